@@ -57,12 +57,16 @@ class Application(ctk.CTk): # pylint: disable=too-few-public-methods
         set_app_icon(self, icon_path)
         self.title('VSCP ToolBox v' + self.version)
 
-        x = int((self.winfo_screenwidth() / 2) - (self.width / 2))
-        y = int((0.95 * (self.winfo_screenheight() / 2)) - (self.height / 2))
+        # Screen dimensions do not change during a session - query them once
+        self.screen_width = self.winfo_screenwidth()
+        self.screen_height = self.winfo_screenheight()
+
+        x = int((self.screen_width / 2) - (self.width / 2))
+        y = int((0.95 * (self.screen_height / 2)) - (self.height / 2))
         self.geometry(f'{self.width}x{self.height}+{x}+{y}')
 
         self.minsize(width=self.width, height=self.height)
-        self.maxsize(width=self.width, height=self.winfo_screenheight() - 80)
+        self.maxsize(width=self.width, height=self.screen_height - 80)
         self.resizable(width=False, height=True)
 
         self.menu = Menu(self)
@@ -11,7 +11,12 @@ import os
 import customtkinter as ctk
 from CTkMessagebox import CTkMessagebox
 import vscp
-from .common import set_app_icon
+from .common import set_app_icon, parse_node_id_input, NODE_ID_INCOMPLETE
+
+
+CURRENT_PATH = os.path.dirname(os.path.realpath(__file__))
+ICON_DIR = os.path.join(CURRENT_PATH, 'icons')
+ICON_PATH = os.path.join(ICON_DIR, 'vscp_logo.ico')
 
 
 class ChangeNodeId(ctk.CTkToplevel): # pylint: disable=too-many-instance-attributes
@@ -34,11 +39,6 @@ class ChangeNodeId(ctk.CTkToplevel): # pylint: disable=too-many-instance-attribu
         self.current_id = current_id
         self.title('Change Node ID')
 
-        current_path = os.path.dirname(os.path.realpath(__file__))
-        icon_dir = os.path.join(current_path, 'icons')
-        icon_path = os.path.join(icon_dir, 'vscp_logo.ico')
-        self.after(250, lambda: set_app_icon(self, icon_path))
-
         width = 270
         height = 130
 
@@ -60,16 +60,16 @@ class ChangeNodeId(ctk.CTkToplevel): # pylint: disable=too-many-instance-attribu
         self.label_new = ctk.CTkLabel(self.frame_input, text="New ID:")
         self.label_new.grid(row=0, column=1, padx=(5, 0), sticky="e")
 
-        self.min_range = [0, 254]
         validate_cmd = (self.register(self._validate_input), '%P')
         self.new_id_var = ctk.StringVar(value="0x")
         self.entry = ctk.CTkEntry(self.frame_input, width=45, textvariable=self.new_id_var,
                                   validate="key", validatecommand=validate_cmd)
-        self.entry.bind("<KeyRelease>", self._format_input)
+        self._format_job = None
+        self.entry.bind("<KeyRelease>", self._schedule_format)
         self.entry.grid(row=0, column=2, padx=(5, 10), sticky="w")
 
-        # Focus handling after delay to ensure window/icon init doesn't steal it
-        self.after(300, self._set_focus)
+        # Icon and focus are set after a delay, icon first so its init doesn't steal the focus
+        self.after(250, self._late_init)
 
         self.frame_buttons = ctk.CTkFrame(self, fg_color='transparent')
         self.frame_buttons.pack(side='top', fill='both', expand=True)
@@ -86,6 +86,12 @@ class ChangeNodeId(ctk.CTkToplevel): # pylint: disable=too-many-instance-attribu
         self.grab_set()
 
 
+    def _late_init(self):
+        """Set the window icon and then the initial focus."""
+        set_app_icon(self, ICON_PATH)
+        self._set_focus()
+
+
     def _set_focus(self):
         """Set initial focus to the entry widget and move cursor to end."""
         self.entry.focus_set()
@@ -95,11 +101,21 @@ class ChangeNodeId(ctk.CTkToplevel): # pylint: disable=too-many-instance-attribu
             pass
 
 
-    def _format_input(self, _):
+    def _schedule_format(self, _):
+        """Debounce formatting so typing bursts and pastes format the input only once."""
+        if self._format_job is not None:
+            self.after_cancel(self._format_job)
+        self._format_job = self.after(30, self._format_input)
+
+
+    def _format_input(self):
         """Format input to hex style (e.g., 0x01)."""
+        self._format_job = None
         input_str = self.new_id_var.get()
         if input_str.lower().startswith('0x'):
-            self.new_id_var.set(input_str[:2].lower() + input_str[2:].upper())
+            formatted = input_str[:2].lower() + input_str[2:].upper()
+            if formatted != input_str:
+                self.new_id_var.set(formatted)
 
 
     def _validate_input(self, input_str):
@@ -107,47 +123,22 @@ class ChangeNodeId(ctk.CTkToplevel): # pylint: disable=too-many-instance-attribu
         Validate input range (0-254) and hex format.
         Also prevents deletion of the '0x' prefix.
         """
-        # Block removal of '0x'
-        if not input_str.lower().startswith('0x'):
+        # Blocks removal of '0x' as well (no prefix -> None)
+        if parse_node_id_input(input_str) is None:
             return False
-
-        result = True
-        if 0 != len(input_str):
-            if input_str.lower().startswith('0x'):
-                if 2 < len(input_str):
-                    if input_str.startswith('0x00'):
-                        result = False
-                    else:
-                        try:
-                            result = self.min_range[0] <= int(input_str, 16) <= self.min_range[1]
-                        except ValueError:
-                            result = False
-            else:
-                # Should not reach here due to prefix check, but kept for logic safety
-                if input_str.startswith('00'):
-                    result = False
-                else:
-                    try:
-                        result = self.min_range[0] <= int(input_str) <= self.min_range[1]
-                    except ValueError:
-                        result = False
-        return result
+        return not input_str.startswith('0x00')
 
 
     def _on_ok(self):
         """Handle OK button click."""
-        try:
-            val_str = self.new_id_var.get()
-            if not val_str or val_str == '0x':
-                return
-            new_id = int(val_str, 0)
-
-            if vscp.is_node_on_list(new_id):
-                CTkMessagebox(title='Error', message=f'Node ID 0x{new_id:02X} already exists!', icon='cancel') # pylint: disable=line-too-long
-                return
-
-            if self.callback:
-                self.callback(self.current_id, new_id)
-            self.destroy()
-        except ValueError:
-            pass
+        new_id = parse_node_id_input(self.new_id_var.get())
+        if new_id in (None, NODE_ID_INCOMPLETE):
+            return
+
+        if vscp.is_node_on_list(new_id):
+            CTkMessagebox(title='Error', message=f'Node ID 0x{new_id:02X} already exists!', icon='cancel') # pylint: disable=line-too-long
+            return
+
+        if self.callback:
+            self.callback(self.current_id, new_id)
+        self.destroy()
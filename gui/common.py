@@ -12,9 +12,15 @@ and references to main UI handles.
 """
 
 
+import re
 import sys
 
 
+NODE_ID_INCOMPLETE = -1
+
+_NODE_ID_INPUT_RE = re.compile(r'0[xX]([0-9A-Fa-f]{0,2})')
+_NODE_ID_MAX = 254
+
 _set_scan_widget_state_cb: object = None
 _neighbours_handle: object = None
 _event_info_handle: object = None
@@ -160,3 +166,26 @@ def set_app_icon(window, icon_path: str):
             window.tk.call('wm', 'iconphoto', window._w, "-default", window._app_icon) # Bypass python wrappers to avoid Pylance false positives # pylint: disable=protected-access
         except Exception: # pylint: disable=broad-exception-caught
             pass
+
+
+def parse_node_id_input(input_str: str) -> int | None:
+    """
+    Parses a '0x'-prefixed hexadecimal Node ID (at most two digits) as typed into an entry widget.
+
+    Shared by the Node ID entry validators, which run on every keystroke.
+
+    Args:
+        input_str: The entry text.
+
+    Returns:
+        int | None: The Node ID (0-254), NODE_ID_INCOMPLETE if only the '0x' prefix
+                    is present, or None if the text is not a valid Node ID.
+    """
+    match = _NODE_ID_INPUT_RE.fullmatch(input_str)
+    if match is None:
+        return None
+    digits = match.group(1)
+    if not digits:
+        return NODE_ID_INCOMPLETE
+    value = int(digits, 16)
+    return value if value <= _NODE_ID_MAX else None
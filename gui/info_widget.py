@@ -16,13 +16,52 @@ Classes:
 
 
 import tkinter as tk
+from tkinter import font as tkfont
 from html.parser import HTMLParser
 import customtkinter as ctk
 
 
+_fonts = {}
+
+# Font (weight, slant) of the text tags produced by SimpleHTMLParser
+_TAG_FONT_STYLES = {
+    "bold":         ("bold", "roman"),
+    "italic":       ("normal", "italic"),
+    "bold_italic":  ("bold", "italic"),
+}
+
+
+def _get_font(widget, family, size, weight='normal', slant='roman'):
+    """
+    Returns a shared Tk font object for the given attributes.
+
+    Fonts are created on first use and reused by all text widgets, so tags
+    refer to one named Tk font instead of a new font description each time.
+
+    Args:
+        widget: Any widget, used as the font root on first creation.
+        family (str): Font family.
+        size (int): Font size.
+        weight (str): 'normal' or 'bold'.
+        slant (str): 'roman' or 'italic'.
+
+    Returns:
+        tkinter.font.Font: The shared font object.
+    """
+    key = (family, size, weight, slant)
+    result = _fonts.get(key)
+    if result is None:
+        result = tkfont.Font(root=widget, family=family, size=size, weight=weight, slant=slant)
+        _fonts[key] = result
+    return result
+
+
 class SimpleHTMLParser(HTMLParser):
     """
     Parses basic HTML tags (b, i, u) and applies corresponding Tkinter text tags.
+
+    Parsed text segments are buffered and written to the widget in a single
+    insert call by flush().
     """
 
     def __init__(self, text_widget, font_family, font_size):
@@ -36,12 +75,10 @@ class SimpleHTMLParser(HTMLParser):
         """
         super().__init__()
         self.text_widget = text_widget
+        self.font_family = font_family
+        self.font_size = font_size
         self.active_tags = []
-
-        self.text_widget.tag_configure("bold", font=(font_family, font_size, "bold"))
-        self.text_widget.tag_configure("italic", font=(font_family, font_size, "italic"))
-        self.text_widget.tag_configure("underline", underline=True)
-        self.text_widget.tag_configure("bold_italic", font=(font_family, font_size, "bold italic"))
+        self.segments = []
 
 
     def handle_starttag(self, tag, attrs):
@@ -58,7 +95,7 @@ class SimpleHTMLParser(HTMLParser):
 
 
     def handle_data(self, data):
-        """Insert text with currently active style tags."""
+        """Buffer text with currently active style tags."""
         if not data:
             return
         tags = []
@@ -75,7 +112,24 @@ class SimpleHTMLParser(HTMLParser):
             tags.remove("italic")
             tags.append("bold_italic")
 
-        self.text_widget.insert("end", data, tuple(tags))
+        self.segments.extend((data, tuple(tags)))
+
+
+    def flush(self):
+        """
+        Insert all buffered segments into the text widget with one Tcl call.
+
+        Only the style tags actually used by the segments are configured.
+        """
+        if self.segments:
+            for tag in {tag for tags in self.segments[1::2] for tag in tags}:
+                if tag == "underline":
+                    self.text_widget.tag_configure(tag, underline=True)
+                else:
+                    weight, slant = _TAG_FONT_STYLES[tag]
+                    self.text_widget.tag_configure(tag, font=_get_font(self.text_widget, self.font_family, self.font_size, weight, slant)) # pylint: disable=line-too-long
+            self.text_widget.insert("end", *self.segments)
+            self.segments.clear()
 
 
 class RichTextLabel(ctk.CTkFrame): # pylint: disable=too-many-ancestors
@@ -109,7 +163,7 @@ class RichTextLabel(ctk.CTkFrame): # pylint: disable=too-many-ancestors
 
         self.text_widget = tk.Text(
             self,
-            font=("Arial", font_size),
+            font=_get_font(self, "Arial", font_size),
             fg=text_color,
             bg=resolved_bg_hex,
             bd=0,
@@ -123,6 +177,8 @@ class RichTextLabel(ctk.CTkFrame): # pylint: disable=too-many-ancestors
 
         parser = SimpleHTMLParser(self.text_widget, "Arial", font_size)
         parser.feed(text)
+        parser.close()
+        parser.flush()
         self.text_widget.configure(state="disabled", cursor="arrow")
 
 
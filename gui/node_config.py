@@ -14,31 +14,29 @@ viewing capabilities implemented).
 
 import os
 import customtkinter as ctk
+from CTkMessagebox import CTkMessagebox
 import vscp
 from .tab_registers import RegistersTab
 from .info_widget import ScrollableInfoTable
 
+CURRENT_PATH = os.path.dirname(os.path.realpath(__file__))
+ICON_DIR = os.path.join(CURRENT_PATH, 'icons')
+ICON_PATH = os.path.join(ICON_DIR, 'vscp_logo.ico')
 
-def new_tag_config(self, tagName, **kwargs): # pylint: disable=invalid-name
-    """
-    Workaround wrapper for the internal Textbox tag_config method.
-
-    Allows configuring tags in CTkTextbox, bypassing some limitations or
-    parameter handling in customtkinter's wrapper.
+_TABS_NAMES = ('Registers', 'Remote Variables', 'Decision Matrix', 'Files')
 
-    Args:
-        self: The CTkTextbox instance.
-        tagName (str): The name of the tag.
-        **kwargs: Configuration options for the tag.
-
-    Returns:
-        The result of the underlying Tkinter text widget's tag_config call.
-    """
-    return self._textbox.tag_config(tagName, **kwargs) # pylint: disable=protected-access
-
-
-# workaround for banning 'font' parameter in the 'tag_config' function
-ctk.CTkTextbox.tag_config = new_tag_config
+# Module info rows displayed by InfoPanel: (data_key, label_text, converter_function)
+_INFO_SCHEMA = (('name',        '<b>Name</b>',                      None),
+                ('model',       '<b>Model</b>',                     None),
+                ('version',     '<b>Version</b>',                   None),
+                ('level',       '<b>VSCP level</b>',                None),
+                ('buffersize',  '<b>max VSCP event size</b>',       None),
+                ('changed',     '<b>Date</b>',                      None),
+                ('algorithm',   '<b>Bootloader Algorithm</b>',      vscp.dictionary.convert_blalgo),
+                ('blockcount',  '<b>Firmware memory blocks</b>',    None),
+                ('blocksize',   '<b>Memory block size</b>',         None),
+                ('infourl',     '<b>Homepage</b>',                  None),
+                ('description', '<b>Description</b>',               None))
 
 
 class NodeConfiguration: # pylint: disable=too-many-instance-attributes, too-few-public-methods
@@ -50,17 +48,19 @@ class NodeConfiguration: # pylint: disable=too-many-instance-attributes, too-few
     (currently focused on registers).
     """
 
-    def __init__(self, parent, node_id: int, guid: str):
+    def __init__(self, parent, node_id: int, guid: str, info_data: dict):
         """
         Initializes the NodeConfiguration window.
 
-        Sets up the window layout, panels (ConfigPanel, InfoPanel), and window
-        properties like geometry and title. Loads module info using VSCP MDF utilities.
+        Sets up the window properties like geometry and title and shows a loading
+        placeholder. The panels (ConfigPanel, InfoPanel) are built right after the
+        window is first painted.
 
         Args:
             parent: The parent widget (Application instance).
             node_id (int): The nickname ID of the node to configure.
             guid (str): The GUID of the node as a string.
+            info_data (dict): Module information already extracted from the MDF.
         """
         super().__init__()
         self.window = ctk.CTkToplevel(parent)
@@ -68,10 +68,7 @@ class NodeConfiguration: # pylint: disable=too-many-instance-attributes, too-few
         self.height = 770
         self.parent = parent
         self.node_id = node_id
-
-        current_path = os.path.dirname(os.path.realpath(__file__))
-        icon_dir = os.path.join(current_path, 'icons')
-        icon_path = os.path.join(icon_dir, 'vscp_logo.ico')
+        self.info_data = info_data
 
         app_window = parent.winfo_toplevel()
         x = int(app_window.winfo_rootx() + (app_window.winfo_width() / 2) - (self.width / 2))
@@ -80,23 +77,58 @@ class NodeConfiguration: # pylint: disable=too-many-instance-attributes, too-few
         self.window.title(f'VSCP ToolBox - Node 0x{self.node_id:02X} GUID: {guid} Configuration')
         self.window.geometry(f'{self.width}x{self.height}+{x}+{y}')
         self.window.minsize(width=self.width, height=self.height)
-        self.window.maxsize(width=self.width, height=self.window.winfo_screenheight() - 80)
+        screen_height = getattr(app_window, 'screen_height', None) or self.window.winfo_screenheight() # pylint: disable=line-too-long
+        self.window.maxsize(width=self.width, height=screen_height - 80)
         self.window.resizable(width=False, height=True)
         self.window.protocol('WM_DELETE_WINDOW', self._window_exit)
-        self.window.after(250, lambda: self.window.iconbitmap(icon_path)) # show icon workaround
-        self.window.bind("<Configure>", lambda e: self._check_maximize())
+        self.window.after(250, lambda: self.window.iconbitmap(ICON_PATH)) # show icon workaround
+        self._maximize_check_job = None
+        self.window.bind("<Configure>", self._on_configure)
 
         self.config_panel = ctk.CTkFrame(self.window, corner_radius=0)
         self.config_panel.pack(fill='both', expand=True)
 
-        self.config = ConfigPanel(self.config_panel, self.node_id)
+        # Paint the window shell first, build the panels once Tk is idle
+        self.config = None
+        self.info_panel = None
+        self.info = None
+        self.loading_label = ctk.CTkLabel(self.config_panel, text='Loading...',
+                                          font=('TkDefaultFont', 22, 'bold'))
+        self.loading_label.pack(expand=True)
+        self.window.update_idletasks()
+        self.window.after_idle(self._populate)
+
+
+    def _populate(self):
+        """
+        Builds the configuration and info panels in place of the loading placeholder.
+
+        Errors raised while building the panels close the window and are reported.
+        """
+        if not self.window.winfo_exists():
+            return
+
+        try:
+            self.loading_label.destroy()
 
-        self.info_panel = ctk.CTkFrame(self.config_panel, height=235)
-        self.info_panel.pack(padx=5, pady=(0, 5), side='top', anchor='s', fill='both', expand=False)
-        self.info_panel.pack_propagate(False)
+            self.config = ConfigPanel(self.config_panel, self.node_id)
 
-        self.info = InfoPanel(self.info_panel)
-        self.info.display({**vscp.mdf.get_module_info(), **vscp.mdf.get_boot_algorithm()})
+            self.info_panel = ctk.CTkFrame(self.config_panel, height=235)
+            self.info_panel.pack(padx=5, pady=(0, 5), side='top', anchor='s', fill='both', expand=False) # pylint: disable=line-too-long
+            self.info_panel.pack_propagate(False)
+
+            self.info = InfoPanel(self.info_panel)
+            self.info.display(self.info_data)
+        except Exception: # pylint: disable=broad-exception-caught
+            self._report_error('Error while parsing an MDF file!!!')
+
+
+    def _report_error(self, message: str):
+        """
+        Closes the configuration window and shows an error message box.
+        """
+        self.parent.close_node_configuration()
+        CTkMessagebox(title='Error', message=message, icon='cancel')
 
 
     def bring_to_front(self):
@@ -111,6 +143,20 @@ class NodeConfiguration: # pylint: disable=too-many-instance-attributes, too-few
         self.window.after(800, lambda: self.window.attributes('-topmost', False))
 
 
+    def _on_configure(self, event):
+        """
+        Schedules the maximize check for the window's own Configure events.
+
+        Configure events of child widgets are ignored, and bursts of events
+        (e.g. during resizing) are debounced into a single check.
+        """
+        if event.widget is not self.window:
+            return
+        if self._maximize_check_job:
+            self.window.after_cancel(self._maximize_check_job)
+        self._maximize_check_job = self.window.after(50, self._check_maximize)
+
+
     def _check_maximize(self):
         """
         Prevents the window from being maximized (zoomed).
@@ -118,6 +164,7 @@ class NodeConfiguration: # pylint: disable=too-many-instance-attributes, too-few
         If the user attempts to maximize the window, this method forces it back
         to the 'normal' state to maintain the fixed layout dimensions.
         """
+        self._maximize_check_job = None
         if self.window.state() == 'zoomed':
             self.window.state('normal')
 
@@ -126,17 +173,22 @@ class NodeConfiguration: # pylint: disable=too-many-instance-attributes, too-few
         """
         Handles the window close event.
 
-        Notifies the parent application to perform cleanup before closing.
+        Cancels a pending maximize check and notifies the parent application
+        to perform cleanup before closing.
         """
+        if self._maximize_check_job:
+            self.window.after_cancel(self._maximize_check_job)
+            self._maximize_check_job = None
         self.parent.close_node_configuration()
 
 
-class InfoPanel(ctk.CTkFrame): # pylint: disable=too-many-ancestors
+class InfoPanel: # pylint: disable=too-few-public-methods
     """
     Displays module information at the bottom of the config window.
 
     Shows details like Name, Model, Version, VSCP Level, etc., extracted from
-    the Module Description File (MDF).
+    the Module Description File (MDF). The info table is placed directly in
+    the parent widget.
     """
 
     def __init__(self, parent):
@@ -147,7 +199,6 @@ class InfoPanel(ctk.CTkFrame): # pylint: disable=too-many-ancestors
             parent: The parent widget.
         """
         self.parent = parent
-        super().__init__(self.parent)
 
         # Retrieve the bg color from the parent widget to ensure visual consistency
         # when ScrollableInfoTable is placed inside it.
@@ -162,6 +213,7 @@ class InfoPanel(ctk.CTkFrame): # pylint: disable=too-many-ancestors
             corner_radius=0
         )
         self.module_info.pack(padx=(5, 5), pady=(5, 5), side='top', anchor='nw', fill='both', expand=True) # pylint: disable=line-too-long
+        self._is_empty = True
 
 
     def display(self, data: dict) -> None:
@@ -171,22 +223,12 @@ class InfoPanel(ctk.CTkFrame): # pylint: disable=too-many-ancestors
         Args:
             data (dict): Dictionary containing module information.
         """
+        if not data and self._is_empty:
+            return
+
         rows = []
         if data:
-            # Structure: (data_key, label_text, converter_function)
-            keys = [('name',        '<b>Name</b>',                      None),
-                    ('model',       '<b>Model</b>',                     None),
-                    ('version',     '<b>Version</b>',                   None),
-                    ('level',       '<b>VSCP level</b>',                None),
-                    ('buffersize',  '<b>max VSCP event size</b>',       None),
-                    ('changed',     '<b>Date</b>',                      None),
-                    ('algorithm',   '<b>Bootloader Algorithm</b>',      vscp.dictionary.convert_blalgo), # pylint: disable=line-too-long
-                    ('blockcount',  '<b>Firmware memory blocks</b>',    None),
-                    ('blocksize',   '<b>Memory block size</b>',         None),
-                    ('infourl',     '<b>Homepage</b>',                  None),
-                    ('description', '<b>Description</b>',               None)]
-
-            for data_key, label_text, converter in keys:
+            for data_key, label_text, converter in _INFO_SCHEMA:
                 val = data.get(data_key, None)
                 if val is not None:
                     label = label_text + ':'
@@ -194,14 +236,16 @@ class InfoPanel(ctk.CTkFrame): # pylint: disable=too-many-ancestors
                     rows.append((label, value_str))
 
         self.module_info.update_data({'rows': rows})
+        self._is_empty = not rows
 
 
-class ConfigPanel(ctk.CTkFrame): # pylint: disable=too-many-ancestors
+class ConfigPanel: # pylint: disable=too-few-public-methods
     """
     Main configuration panel containing tabs for different settings categories.
 
     Manages tabs like 'Registers', 'Remote Variables', 'Decision Matrix', etc.
-    Currently, only the 'Registers' tab is fully initialized.
+    Currently, only the 'Registers' tab is fully initialized. The tabview is
+    placed directly in the parent widget.
     """
 
     def __init__(self, parent, node_id: int):
@@ -215,18 +259,17 @@ class ConfigPanel(ctk.CTkFrame): # pylint: disable=too-many-ancestors
             parent: The parent widget.
             node_id: The ID of the node being configured.
         """
-        super().__init__(parent)
         self.node_id = node_id
 
         self.widget = ctk.CTkTabview(parent)
         self.widget.pack(padx=5, pady=(0, 5), fill='both', expand=True)
 
-        self.tabs_names =['Registers', 'Remote Variables', 'Decision Matrix', 'Files']
+        self.tabs_names = _TABS_NAMES
         self.tabs = []
         labels = []
         for idx, tab in enumerate(self.tabs_names):
             self.tabs.append(self.widget.add(tab))
-            if 0 < idx:
+            if idx > 0:
                 labels.append(ctk.CTkLabel(self.widget.tab(tab), text='UNIMPLEMENTED',
                                            font=('TkDefaultFont', 22, 'bold'), pady=40).pack())
         self.widget.set(self.tabs_names[0])
@@ -13,18 +13,22 @@ firmware upload and configuration.
 
 import os
 import re
-from pathlib import Path
+import time
+import asyncio
+import hashlib
+from functools import partial
+from itertools import count
+from collections import OrderedDict
 from typing import Any, cast
-import requests
 import tk_async_execute as tae
 import customtkinter as ctk
 from CTkMessagebox import CTkMessagebox
-from intelhex import IntelHex
 import vscp
 from .treeview import CTkTreeview
 from .common import add_set_state_callback, add_neighbours_handle,  \
                     neighbours_handle, call_set_filter_blocking,    \
-                    set_auto_discovery
+                    set_auto_discovery, parse_node_id_input,        \
+                    NODE_ID_INCOMPLETE
 from .popup import CTkFloatingWindow
 from .node_config import NodeConfiguration
 from .change_node_id import ChangeNodeId
@@ -32,6 +36,138 @@ from .device_provisioner import DeviceProvisioner
 from .http_server import get_http_server_port
 
 
+_HEX_PREFIXES = ('0x', '0X')
+_HEX_STRIP_RE = re.compile(r'[^0-9a-fA-F]')
+_VSCP_LOCAL_RE = re.compile(r'vscp\.local', re.IGNORECASE)
+_MDF_CACHE_SIZE = 32
+# (connect, read) timeouts: unreachable MDF hosts fail fast, slow downloads still get 5 s
+_MDF_TIMEOUT = (1.0, 5)
+# Downloaded MDFs are kept on disk between sessions; they are static per firmware version
+_MDF_DISK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'vscp4can', 'mdf')
+_MDF_DISK_CACHE_TTL = 24 * 60 * 60
+_ID_MIN = 0
+_ID_MAX = 254
+# Node rows inserted per idle callback, so a large scan result does not freeze the UI
+_INSERT_BATCH = 32
+# Node labels/iids are formatted once per possible nickname instead of on every reload
+_NODE_IIDS = tuple(f'node_{i}' for i in range(256))
+_NODE_LABELS = tuple(f'0x{i:02X}' for i in range(256))
+_HARD_CODED_NODE_LABELS = tuple(f'►0x{i:02X}◄' for i in range(256))
+# MDF links from the node usually omit the scheme; one that already has it is used as is
+_URL_SCHEMES = ('http://', 'https://')
+# Neighbours treeview columns: (id, text, width, minwidth, anchor, cell_anchor)
+_NEIGHBOUR_HEADER = (('node', 'Node', 75, 75, 'center', 'w'),
+                     ('description', '', 356, 356, 'center', 'w'),
+                    )
+# Shared look and layout of the neighbours context menu buttons
+_MENU_BUTTON_KWARGS = {'border_spacing': 0, 'corner_radius': 0, 'width': 190}
+_MENU_BUTTON_PACK = {'expand': True, 'fill': 'x', 'padx': 0, 'pady': 0}
+
+_session = None
+
+
+def _http_session():
+    """
+    Return the shared HTTP session used for MDF downloads.
+
+    MDF downloads reuse pooled connections instead of opening a new one per request.
+    'requests' is imported on first use only, it is not needed to start the GUI.
+    """
+    global _session # pylint: disable=global-statement
+    if _session is None:
+        import requests # pylint: disable=import-outside-toplevel
+        from requests.adapters import HTTPAdapter # pylint: disable=import-outside-toplevel
+        _session = requests.Session()
+        _session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return _session
+
+
+def _read_file(path: str) -> bytes:
+    """
+    Read a whole file.
+
+    Returns:
+        bytes: The file content, or empty bytes if it could not be read.
+    """
+    try:
+        with open(path, 'rb') as file:
+            return file.read()
+    except OSError:
+        return b''
+
+
+def _mdf_disk_cache_path(mdf_link: str) -> str:
+    """
+    Return the on-disk cache file of an MDF link.
+    """
+    return os.path.join(_MDF_DISK_CACHE_DIR, hashlib.sha1(mdf_link.encode()).hexdigest() + '.xml')
+
+
+def _read_cached_mdf(mdf_link: str) -> bytes:
+    """
+    Read an MDF from the disk cache.
+
+    Returns:
+        bytes: The cached MDF, or empty bytes if it is missing or older than the TTL.
+    """
+    path = _mdf_disk_cache_path(mdf_link)
+    try:
+        if time.time() - os.path.getmtime(path) > _MDF_DISK_CACHE_TTL:
+            return b''
+    except OSError:
+        return b''
+    return _read_file(path)
+
+
+def _write_cached_mdf(mdf_link: str, mdf: bytes) -> None:
+    """
+    Store an MDF in the disk cache (atomically, so readers never see a partial file).
+    """
+    path = _mdf_disk_cache_path(mdf_link)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(_MDF_DISK_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'wb') as file:
+            file.write(mdf)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _parse_mdf_info(mdf_text: str) -> dict:
+    """
+    Parse MDF content and extract the module information shown by the config window.
+
+    Both steps run in one worker call, so the shared MDF parser is not accessed concurrently.
+
+    Returns:
+        dict: Module info merged with the bootloader algorithm details.
+    """
+    vscp.mdf.parse(mdf_text)
+    return {**vscp.mdf.get_module_info(), **vscp.mdf.get_boot_algorithm()}
+
+
+def _read_firmware(fw_path: str, extension: str) -> bytearray:
+    """
+    Load a firmware image file into a contiguous byte buffer.
+
+    Args:
+        fw_path (str): Path to the firmware file.
+        extension (str): File format understood by IntelHex ('hex' or 'bin').
+
+    Returns:
+        bytearray: The firmware image.
+    """
+    # A raw binary image is already the flat buffer, no IntelHex round trip needed
+    if 'bin' == extension:
+        with open(fw_path, 'rb') as file:
+            return bytearray(file.read())
+    from intelhex import IntelHex # pylint: disable=import-outside-toplevel
+    fw = IntelHex()
+    fw.fromfile(fw_path, format=extension)
+    return bytearray(fw.tobinarray())
+
+
 class AlignedReverseCheckBox(ctk.CTkFrame): # pylint: disable=too-many-ancestors
     """
     Custom Checkbox widget with label on the left and checkbox on the right.
@@ -173,33 +309,41 @@ class ScanWidget(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-i
 
         # Track external state (connection status)
         self._external_state = 'disabled'
+        # Last accepted Start/Stop IDs, so each validator cross-checks
+        # without reading the other Tk variable
+        self._accepted_min = _ID_MIN
+        self._accepted_max = _ID_MAX
+        # Pending debounced ID formatting jobs, keyed by entry widget
+        self._format_jobs = {}
+        # Last applied control/checkbox states, so unchanged widgets are not reconfigured
+        self._last_state_controls = None
+        self._last_state_checkbox = None
 
         self.widget = ctk.CTkFrame(self.parent)
         self.widget.pack(padx=5, pady=(20, 0), anchor='nw', fill='x', expand=False)
 
-        self.min_range = [0, 254]
-        self.max_range = [0, 254]
-
         # Define variables first to ensure they exist for validation callbacks
-        self.min_id_var = ctk.StringVar(value=f'0x{self.min_range[0]:02X}')
-        self.max_id_var = ctk.StringVar(value=f'0x{self.max_range[1]:02X}')
+        self.min_id_var = ctk.StringVar(value=f'0x{_ID_MIN:02X}')
+        self.max_id_var = ctk.StringVar(value=f'0x{_ID_MAX:02X}')
 
         self.l_min_id = ctk.CTkLabel(self.widget, corner_radius=0, text='Start ID:')
         self.l_min_id.grid(row=0, column=0, sticky='w', pady=5, padx=(5, 0))
 
-        validate_min_id = (self.register(self._validate_start), '%P')
+        validate_min_id = (self.register(partial(self._validate_id, True)), '%P')
         self.min_id = ctk.CTkEntry(self.widget, width=45, textvariable=self.min_id_var,
                                    validate="key", validatecommand=validate_min_id)
-        self.min_id.bind("<KeyRelease>", self._min_id_format)
+        self.min_id.bind("<KeyRelease>",
+                         lambda _: self._schedule_id_format(self.min_id_var, self.min_id))
         self.min_id.grid(row=0, column=1, sticky='w', pady=5, padx=(3, 0))
 
         self.l_max_id = ctk.CTkLabel(self.widget, corner_radius=0, text='Stop ID:')
         self.l_max_id.grid(row=0, column=2, sticky='w', pady=5, padx=(10, 0))
 
-        validate_max_id = (self.register(self._validate_stop), '%P')
+        validate_max_id = (self.register(partial(self._validate_id, False)), '%P')
         self.max_id = ctk.CTkEntry(self.widget, width=45, textvariable=self.max_id_var,
                                    validate="key", validatecommand=validate_max_id)
-        self.max_id.bind("<KeyRelease>", self._max_id_format)
+        self.max_id.bind("<KeyRelease>",
+                         lambda _: self._schedule_id_format(self.max_id_var, self.max_id))
         self.max_id.grid(row=0, column=3, sticky='w', pady=5, padx=(3,0))
 
         self.button_scan = ctk.CTkButton(self.widget, width=50, text='Scan',
@@ -209,7 +353,6 @@ class ScanWidget(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-i
         # Push column 6 (Auto-discovery) to the far right edge of the frame
         self.widget.grid_columnconfigure(5, weight=1)
 
-        self.auto_disc_var = ctk.StringVar(value="on")
         self.chk_auto_disc = AlignedReverseCheckBox(self.widget, text="Auto-discovery",
                                                     label_width=100,
                                                     command=self._toggle_auto_discovery)
@@ -262,15 +405,19 @@ class ScanWidget(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-i
         if is_auto_disc:
             state_controls = 'disabled'
 
-        # Apply states
-        self.l_min_id.configure(state=state_controls)
-        self.min_id.configure(state=state_controls)
-        self.l_max_id.configure(state=state_controls)
-        self.max_id.configure(state=state_controls)
-        self.button_scan.configure(state=state_controls)
+        # Apply states (each configure redraws the widget, so skip unchanged ones)
+        if state_controls != self._last_state_controls:
+            self._last_state_controls = state_controls
+            self.l_min_id.configure(state=state_controls)
+            self.min_id.configure(state=state_controls)
+            self.l_max_id.configure(state=state_controls)
+            self.max_id.configure(state=state_controls)
+            self.button_scan.configure(state=state_controls)
 
         # Checkbox state logic
-        self.chk_auto_disc.configure(state=state_checkbox)
+        if state_checkbox != self._last_state_checkbox:
+            self._last_state_checkbox = state_checkbox
+            self.chk_auto_disc.configure(state=state_checkbox)
 
 
     def set_scan_widget_state(self, state):
@@ -283,174 +430,120 @@ class ScanWidget(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-i
             state: The state to set ('normal' or 'disabled').
         """
         # pylint: enable=line-too-long
+        # Busy/idle notifications repeat often; nothing to re-evaluate if the state is the same
+        if state == self._external_state:
+            return
         self._external_state = state
         self._update_ui_state()
 
 
-    def _min_id_format(self, _):
-        """Format the Start ID input to hex style (e.g., 0x01) on key release."""
-        input_str = self.min_id_var.get()
-
-        if not input_str.lower().startswith('0x'):
-            clean_hex = ''.join(filter(lambda x: x in '0123456789abcdefABCDEF', input_str))
-            new_val = f'0x{clean_hex}'
-            self.min_id_var.set(new_val)
-            self.min_id.icursor('end')
-            return
-
-        if input_str.lower().startswith('0x'):
-            self.min_id_var.set(input_str[:2].lower() + input_str[2:].upper())
-
-
-    def _validate_start(self, input_str):
+    def _schedule_id_format(self, id_var, entry):
         """
-        Validate the Start ID input.
-        Returns True if input is valid, False otherwise.
-        """
-        if not input_str.lower().startswith('0x'):
-            return False
-
-        # Allow incomplete '0x' during editing
-        if len(input_str) < 3:
-            return True
-
-        is_valid = False
-        try: # pylint: disable=too-many-nested-blocks
-            val = int(input_str, 16)
-
-            # Global range check (0-254)
-            if self.min_range[0] <= val <= self.min_range[1]:
-                is_valid = True
-
-                # Cross-check: Start ID must be <= Stop ID
-                if hasattr(self, 'max_id_var'):
-                    try:
-                        current_max_str = self.max_id_var.get()
-                        if len(current_max_str) > 2:
-                            max_val = int(current_max_str, 16)
-                            if val > max_val:
-                                is_valid = False
-                    except ValueError:
-                        pass # Stop ID is invalid, relax constraint
-
-        except (ValueError, Exception): # pylint: disable=broad-exception-caught
-            # Fallback to prevent disabling validation permanently
-            is_valid = False
+        Debounce ID formatting on key release.
 
-        return is_valid
+        Typing bursts and pastes fire several key releases in a row; only the last one
+        within 30 ms triggers the formatting (and the revalidation it causes).
+        """
+        job = self._format_jobs.pop(entry, None)
+        if job is not None:
+            self.after_cancel(job)
+        self._format_jobs[entry] = self.after(30, self._id_format, id_var, entry)
 
 
-    def _max_id_format(self, _):
-        """Format the Stop ID input to hex style (e.g., 0xFF) on key release."""
-        input_str = self.max_id_var.get()
+    def _id_format(self, id_var, entry):
+        """Format a Start/Stop ID input to hex style (e.g., 0x01)."""
+        self._format_jobs.pop(entry, None)
+        input_str = id_var.get()
 
-        if not input_str.lower().startswith('0x'):
-            clean_hex = ''.join(filter(lambda x: x in '0123456789abcdefABCDEF', input_str))
-            new_val = f'0x{clean_hex}'
-            self.max_id_var.set(new_val)
-            self.max_id.icursor('end')
+        if input_str[:2] not in _HEX_PREFIXES:
+            clean_hex = _HEX_STRIP_RE.sub('', input_str)
+            id_var.set(f'0x{clean_hex}')
+            entry.icursor('end')
             return
 
-        if input_str.lower().startswith('0x'):
-            self.max_id_var.set(input_str[:2].lower() + input_str[2:].upper())
+        # Setting the variable revalidates the entry, so skip it when nothing changes
+        formatted = '0x' + input_str[2:].upper()
+        if formatted != input_str:
+            id_var.set(formatted)
 
 
-    def _validate_stop(self, input_str):
+    def _validate_id(self, is_start, input_str):
         """
-        Validate the Stop ID input.
+        Validate the Start ID (is_start=True) or Stop ID input.
+
+        Keeps Start ID <= Stop ID, relaxed while the other entry is incomplete. For the
+        Stop ID a "lookahead" accepts a prefix that can still grow to a value >= Start ID.
         Returns True if input is valid, False otherwise.
         """
-        if not input_str.lower().startswith('0x'):
+        val = parse_node_id_input(input_str)
+        if val is None:
             return False
 
+        peer = self._accepted_max if is_start else self._accepted_min
         # Allow incomplete '0x' during editing
-        if len(input_str) < 3:
-            return True
-
-        is_valid = False
-        try: # pylint: disable=too-many-nested-blocks
-            val = int(input_str, 16)
-
-            # Global range check (0-254)
-            if self.max_range[0] <= val <= self.max_range[1]:
-                is_valid = True
-
-                # Cross-check: Stop ID must be >= Start ID
-                if hasattr(self, 'min_id_var'):
-                    try:
-                        current_min_str = self.min_id_var.get()
-                        if len(current_min_str) > 2:
-                            min_val = int(current_min_str, 16)
-
-                            # Check "lookahead": Is it possible to form a valid number
-                            # >= min_val from this input?
-                            missing_chars = 4 - len(input_str)
-                            missing_chars = max(missing_chars, 0)
-
-                            # Construct the largest possible number starting with input_str
-                            potential_max_str = input_str + ('F' * missing_chars)
-                            potential_max_val = int(potential_max_str, 16)
-
-                            if potential_max_val < min_val:
-                                is_valid = False
-                    except ValueError:
-                        pass # Start ID is invalid, relax constraint
-
-        except (ValueError, Exception): # pylint: disable=broad-exception-caught
-            is_valid = False
+        if NODE_ID_INCOMPLETE in (val, peer):
+            is_valid = True
+        elif is_start:
+            is_valid = val <= peer
+        else:
+            # Largest number starting with input_str: append all-ones nibbles
+            pad_bits = max(4 - len(input_str), 0) * 4
+            is_valid = (val << pad_bits) | ((1 << pad_bits) - 1) >= peer
 
+        if is_valid:
+            if is_start:
+                self._accepted_min = val
+            else:
+                self._accepted_max = val
         return is_valid
 
 
     def _button_scan_callback(self):
         """Initiate the scan process asynchronously."""
-        min_str = self.min_id_var.get()
-        max_str = self.max_id_var.get()
+        # The validators already parsed both entries; reuse their values instead of re-parsing
+        min_val = self._accepted_min
+        max_val = self._accepted_max
         error_msg = None
 
-        if len(min_str) < 3:
+        if NODE_ID_INCOMPLETE == min_val:
             error_msg = "Start ID is invalid (empty or incomplete)."
-        elif len(max_str) < 3:
+        elif NODE_ID_INCOMPLETE == max_val:
             error_msg = "Stop ID is invalid (empty or incomplete)."
-        else:
-            try:
-                min_val = int(min_str, 16)
-                max_val = int(max_str, 16)
-
-                if min_val > max_val:
-                    error_msg = f"Start ID (0x{min_val:02X}) cannot be greater than Stop ID (0x{max_val:02X})." # pylint: disable=line-too-long
-                elif not 0 <= min_val <= 254:
-                    error_msg = "Start ID must be between 0x00 and 0xFE."
-                elif not 0 <= max_val <= 254:
-                    error_msg = "Stop ID must be between 0x00 and 0xFE."
-            except ValueError:
-                error_msg = "Invalid hexadecimal format."
+        elif min_val > max_val:
+            # Inverted range: nothing to scan, do not touch the bus
+            error_msg = f"Start ID (0x{min_val:02X}) cannot be greater than Stop ID (0x{max_val:02X})." # pylint: disable=line-too-long
 
         if error_msg:
             CTkMessagebox(title='Error', message=error_msg, icon='cancel')
             return
 
-        tae.async_execute(self._call_scan(), visible=False)
+        tae.async_execute(self._call_scan(min_val, max_val), visible=False)
 
 
-    async def _call_scan(self):
+    async def _call_scan(self, min_id, max_id):
         """
         Perform the actual node scanning logic.
 
-        Reads the min/max ID, calls the vscp library to scan, and populates
+        Calls the vscp library to scan the given ID range and populates
         the neighbours treeview with results.
-        """
-        try:
-            min_id = int(self.min_id_var.get(), 16)
-            max_id = int(self.max_id_var.get(), 16)
-        except ValueError:
-            return
 
-        nodes = await vscp.scan(min_id, max_id)
-        if 0 < nodes:
-            handle = neighbours_handle()
-            if hasattr(handle, 'reload_data'):
-                cast(Any, handle).reload_data()
+        Args:
+            min_id (int): First node ID to scan (already validated).
+            max_id (int): Last node ID to scan (already validated).
+        """
+        handle = cast(Any, neighbours_handle())
+        can_reload = hasattr(handle, 'reload_data')
+        # Nodes are shown as soon as their info arrives; reload_data only appends the new rows.
+        # The treeview is only touched from the Tk thread, so reloads are handed over with after().
+        nodes = await vscp.scan(min_id, max_id, on_node=(lambda _: handle.after(0, handle.reload_data)) if can_reload else None) # pylint: disable=line-too-long
+        # -1: bus busy, nothing scanned. An empty result must still clear stale rows,
+        # which is cheap as reload_data skips work when the node list did not change.
+        if -1 < nodes:
+            if can_reload:
+                handle.after(0, handle.reload_data)
+            if 0 < nodes and hasattr(handle, 'prefetch_mdfs'):
+                # Queued after the reload, so the links are taken from the refreshed list
+                handle.after(0, handle.prefetch_mdfs)
 
 
 class Neighbours(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-instance-attributes
@@ -473,48 +566,46 @@ class Neighbours(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-i
         self.selected_row_id = ''
         self.parent = parent
         self.config_window = None
+        self._row_lookup = {}
+        self._rendered_nodes = {}
+        self._rendered_generation = -1
+        self._unpopulated_nodes = set()
+        self._mdf_cache = OrderedDict()
+        # Pending idle-time insert batches, keyed by a per-batch token
+        self._insert_jobs = {}
+        self._insert_tokens = count()
 
-        header = [('node', 'Node', 75, 75, 'center', 'w'),
-                  ('description', '', 356, 356, 'center', 'w'),
-                 ]
         self.widget = ctk.CTkFrame(parent, fg_color='transparent')
         self.widget.pack(padx=0, pady=5, side='top', anchor='nw', fill='both', expand=True)
-        self.neighbours = CTkTreeview(self.widget, header, xscroll=False)
+        self.neighbours = CTkTreeview(self.widget, _NEIGHBOUR_HEADER, xscroll=False)
         self.neighbours.pack(padx=0, pady=0, fill='both', expand=True)
         self.neighbours.treeview.bind('<Double-Button-1>', self._item_deselect)
-        self.neighbours.treeview.bind('<Button-3>', lambda event: self._show_menu(event, self.dropdown))
+        self.neighbours.treeview.bind('<<TreeviewOpen>>', self._on_node_open)
+        self.neighbours.treeview.bind('<Button-3>', lambda event: self._show_menu(event, self._get_dropdown()))
+
+        # The context menu is built once the main window is up, not during start-up
+        self.dropdown = None
+        self._menu_buttons = ()
+        self._last_menu_state = 'normal'
+        self.after_idle(self._get_dropdown)
 
+
+    def _get_dropdown(self):
+        """
+        Return the context menu, building it on first use.
+        """
+        if self.dropdown is not None:
+            return self.dropdown
         self.dropdown = CTkFloatingWindow(self.neighbours)
-        self.dropdown_bt_chg_node_id = ctk.CTkButton(self.dropdown.frame, border_spacing=0, corner_radius=0, width=190,
-                                                     text="Change Node ID", command=self._change_node_id)
-        self.dropdown_bt_chg_node_id.pack(expand=True, fill="x", padx=0, pady=0)
-        self.dropdown_bt_configure = ctk.CTkButton(self.dropdown.frame, border_spacing=0, corner_radius=0, width=190,
-                                                   text="Configure Node", command=self._configure_node)
-        self.dropdown_bt_configure.pack(expand=True, fill="x", padx=0, pady=0)
-        self.dropdown_bt_drop_id_or_reset = ctk.CTkButton(self.dropdown.frame, border_spacing=0, corner_radius=0, width=190,
-                                                          text="Drop Node ID / Reset Device", command=self._drop_id_or_reset)
-        self.dropdown_bt_drop_id_or_reset.pack(expand=True, fill="x", padx=0, pady=0)
-        self.dropdown_bt_firmware = ctk.CTkButton(self.dropdown.frame, border_spacing=0, corner_radius=0, width=190,
-                                                  text="Upload Firmware", command=self._firmware_upload)
-        self.dropdown_bt_firmware.pack(expand=True, fill="x", padx=0, pady=0)
-        # TODO remove
-        # data = []
-        # for idx in range(5, 15):
-        #     node_id = f"0x{idx:02X}"
-        #     entry = {'text': node_id,
-        #                 'child': [{'text': 'GUID:', 'values': f'FA:FA:FA:{idx:02d}'},
-        #                           {'text': 'MDF:',  'values': f'http://vscp.local/mdf/xxx{idx}.mdf'}
-        #                          ]
-        #             }
-        #     data.append(entry)
-        #     entry = {'id': idx,
-        #              'isHardCoded': False,
-        #              'guid': {'val': [0xFA, 0xFA, 0xFA, idx], 'str': f'FA:FA:FA:{idx:02X}'},
-        #              'mdf': f'http://vscp.local/mdf/xxx{idx}.mdf'
-        #             }
-        #     vscp.append_node(entry)
-        #     # print(entry)
-        # self.insert(data)
+        # Buttons start in the state last requested by _set_menu_items_state
+        self._menu_buttons = tuple(ctk.CTkButton(self.dropdown.frame, text=text, command=command, state=self._last_menu_state, **_MENU_BUTTON_KWARGS)
+                                   for text, command in (('Change Node ID', self._change_node_id),
+                                                         ('Configure Node', self._configure_node),
+                                                         ('Drop Node ID / Reset Device', self._drop_id_or_reset),
+                                                         ('Upload Firmware', self._firmware_upload)))
+        for button in self._menu_buttons:
+            button.pack(**_MENU_BUTTON_PACK)
+        return self.dropdown
 
 
     def insert(self, row_data):
@@ -532,48 +623,111 @@ class Neighbours(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-i
         Reload and display the list of nodes from VSCP storage.
         Preserves the expanded/collapsed state of existing nodes.
         """
-        expanded_nodes = set()
-        for child_id in self.neighbours.treeview.get_children():
-            # If the item is open (expanded), save its text (Node ID)
-            if self.neighbours.treeview.item(child_id, 'open'):
-                item_text = self.neighbours.treeview.item(child_id, 'text')
-                expanded_nodes.add(item_text)
+        generation = vscp.get_nodes_generation()
+        if generation == self._rendered_generation:
+            return
 
-        self.delete_all_items()
+        # Hard-coded nodes keep node_id -1: their '►0x..◄' label was never accepted as a Node ID
+        # Nodes still waiting for their GUID/MDF (mid-scan) are shown once their info arrives
+        node_meta = {_NODE_IIDS[node['id']]: {'text':    _HARD_CODED_NODE_LABELS[node['id']] if hard_coded else _NODE_LABELS[node['id']], # pylint: disable=line-too-long
+                                              'node_id': -1 if hard_coded else node['id'],
+                                              'guid':    node['guid']['str'],
+                                              'mdf':     mdf if mdf.startswith(_URL_SCHEMES) else f'http://{mdf}'}
+                     for node in vscp.get_nodes() if 'guid' in node
+                     for hard_coded, mdf in ((node.get('isHardCoded', False) is True, node['mdf']),)}
+        # Nothing to repaint if the tree already shows exactly these nodes
+        if node_meta == self._rendered_nodes:
+            self._rendered_generation = generation
+            return
 
-        data = []
-        for node in vscp.get_nodes():
-            node_id = f"0x{node['id']:02X}"
-            if node.get('isHardCoded', False) is True:
-                node_id = '►' + node_id + '◄'
+        rendered_count = len(self._rendered_nodes)
+        node_items = list(node_meta.items())
+        if 0 < rendered_count and node_items[:rendered_count] == list(self._rendered_nodes.items()):
+            # Nodes were only appended (scan results arriving one by one): add just the new rows
+            node_items = node_items[rendered_count:]
+            expanded_nodes = set()
+        else:
+            treeview = self.neighbours.treeview
+            # Remember which node rows are expanded (iids are stable per node ID)
+            expanded_nodes = {iid for iid in treeview.get_children() if treeview.item(iid, 'open')}
+            self.delete_all_items()
+        self._rendered_nodes = node_meta
+        self._rendered_generation = generation
+
+        # Every row (node and its GUID/MDF children) resolves to the same metadata
+        self._row_lookup.update({row: meta for iid, meta in node_items
+                                           for row in (iid, f'{iid}_guid', f'{iid}_mdf')})
+
+        # GUID/MDF rows of collapsed nodes are inserted on first expansion (placeholder keeps the arrow)
+        self._unpopulated_nodes.update(iid for iid, _ in node_items if iid not in expanded_nodes)
+        data = [{'iid': iid,
+                 'text': meta['text'],
+                 'open': iid in expanded_nodes,
+                 'child': [{'iid': f'{iid}_placeholder', 'text': ''}] if iid in self._unpopulated_nodes
+                          else self._node_children(iid, meta)
+                } for iid, meta in node_items]
+
+        # Rows are inserted in idle-time batches so redraws and input are served in between
+        for start in range(0, len(data), _INSERT_BATCH):
+            token = next(self._insert_tokens)
+            self._insert_jobs[token] = self.after_idle(partial(self._insert_batch, token, data[start:start + _INSERT_BATCH]))
+
+
+    def _insert_batch(self, token, rows):
+        """
+        Insert one batch of node rows scheduled by reload_data.
 
-            is_open = node_id in expanded_nodes
+        Args:
+            token (int): Key of this batch's job in the pending insert jobs.
+            rows (list): Node rows to insert.
+        """
+        self._insert_jobs.pop(token, None)
+        self.neighbours.insert_items(rows, auto_scroll=False)
+
+
+    @staticmethod
+    def _node_children(iid, meta) -> list:
+        """
+        Build the GUID/MDF child rows of a node row.
+        """
+        return [{'iid': f'{iid}_guid', 'text': 'GUID:', 'values': [meta['guid']]},
+                {'iid': f'{iid}_mdf',  'text': 'MDF:',  'values': [meta['mdf']]}
+               ]
 
-            entry = {'text': node_id,
-                     'open': is_open,
-                     'child': [{'text': 'GUID:', 'values': [node['guid']['str']]},
-                               {'text': 'MDF:',  'values': ['http://' + node['mdf']]}
-                              ]
-                    }
-            data.append(entry)
 
-        if len(data) > 0:
-            self.neighbours.insert_items(data, auto_scroll=False)
+    def _on_node_open(self, _):
+        """
+        Insert the GUID/MDF rows of a node when it is expanded for the first time.
+        """
+        iid = self.neighbours.treeview.focus()
+        if iid not in self._unpopulated_nodes:
+            return
+        self._unpopulated_nodes.discard(iid)
+        self.neighbours.treeview.delete(f'{iid}_placeholder')
+        self.neighbours.insert_items(self._node_children(iid, self._row_lookup[iid]), parent=iid, auto_scroll=False) # pylint: disable=line-too-long
 
 
     def _item_deselect(self, event):
         """Handle double-click to deselect an item in the treeview."""
-        selected_rows = self.neighbours.treeview.selection()
-        row_clicked = self.neighbours.treeview.identify('row', event.x, event.y)
-        index = selected_rows.index(row_clicked) if row_clicked in selected_rows else -1
-        if -1 < index:
-            self.neighbours.treeview.selection_remove(selected_rows[index])
+        treeview = self.neighbours.treeview
+        selected_rows = treeview.selection()
+        if not selected_rows:
+            return
+        row_clicked = treeview.identify('row', event.x, event.y)
+        if row_clicked in selected_rows:
+            treeview.selection_remove(row_clicked)
 
 
     def delete_all_items(self) -> None:
-        """Remove all items from the neighbours treeview."""
-        for item in self.neighbours.treeview.get_children():
-            self.neighbours.treeview.delete(item)
+        """Remove all items from the neighbours treeview and forget their cached metadata."""
+        for job in self._insert_jobs.values():
+            self.after_cancel(job)
+        self._insert_jobs = {}
+        self.neighbours.delete_all_items()
+        self._row_lookup = {}
+        self._rendered_nodes = {}
+        self._rendered_generation = -1
+        self._unpopulated_nodes = set()
 
 
     def _show_menu(self, event, menu):
@@ -592,9 +746,11 @@ class Neighbours(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-i
         """
         Set the enabled/disabled state of the context menu items.
         """
-        self.dropdown_bt_firmware.configure(state=state)
-        self.dropdown_bt_configure.configure(state=state)
-        self.dropdown_bt_chg_node_id.configure(state=state)
+        if state == self._last_menu_state:
+            return
+        self._last_menu_state = state
+        for button in self._menu_buttons:
+            button.configure(state=state)
 
 
     def _get_node_id(self) -> int:
@@ -604,50 +760,19 @@ class Neighbours(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-i
         Returns:
             int: The node ID, or -1 if invalid or not found.
         """
-        parent_id = self.neighbours.treeview.parent(self.selected_row_id)
-        text = self.neighbours.treeview.item(parent_id)['text'] if parent_id else   \
-               self.neighbours.treeview.item(self.selected_row_id)['text']
-        try:
-            result = int(text, 0)
-        except ValueError:
-            result = -1
-        return result
+        meta = self._row_lookup.get(self.selected_row_id)
+        return meta['node_id'] if meta else -1
 
 
-    def _get_mdf_link(self) -> str:
-        """
-        Retrieve the MDF link associated with the selected node.
+    def _get_node_metadata(self) -> tuple[int, str, str]:
         """
-        result = ''
-        parent_id = self.neighbours.treeview.parent(self.selected_row_id)
-        if not parent_id:
-            parent_id = self.selected_row_id
-        for item in self.neighbours.treeview.get_children(item=parent_id):
-            if 'MDF' in self.neighbours.treeview.item(item)['text']:
-                try:
-                    result = self.neighbours.treeview.item(item)['values'][0]
-                    break
-                except KeyError:
-                    pass
-        return result
-
+        Retrieve the Node ID, GUID and MDF link of the selected node in one lookup.
 
-    def _get_guid(self) -> str:
-        """
-        Retrieve the GUID of the selected node.
+        Returns:
+            tuple: (node_id, guid, mdf_link); (-1, '', '') if no node is selected.
         """
-        result = ''
-        parent_id = self.neighbours.treeview.parent(self.selected_row_id)
-        if not parent_id:
-            parent_id = self.selected_row_id
-        for item in self.neighbours.treeview.get_children(item=parent_id):
-            if 'GUID' in self.neighbours.treeview.item(item)['text']:
-                try:
-                    result = self.neighbours.treeview.item(item)['values'][0]
-                    break
-                except KeyError:
-                    pass
-        return result
+        meta = self._row_lookup.get(self.selected_row_id)
+        return (meta['node_id'], meta['guid'], meta['mdf']) if meta else (-1, '', '')
 
 
     def _confirm_firmware_upload(self, node_id: int) -> bool:
@@ -680,49 +805,62 @@ class Neighbours(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-i
                                                      filetypes=filetypes)
             if '' != fw_path:
                 if self._confirm_firmware_upload(node_id) is True:
-                    extension = os.path.splitext(fw_path)[1][1:].lower()
-                    fw = IntelHex()
-                    try:
-                        fw.fromfile(fw_path, format=extension)
-                        fw_data = fw.tobinarray().tolist()
-
-                        # Define async task to handle filter toggling and upload via Observer
-                        async def _upload_task():
-                            # 1. Hide all messages (Publish event: Block=True)
-                            call_set_filter_blocking(True)
-
-                            try:
-                                # 2. Execute bootloader procedure
-                                await vscp.firmware_upload(node_id, fw_data)
-                            finally:
-                                # 3. Restore filter state (Publish event: Block=False)
-                                call_set_filter_blocking(False)
-
-                        tae.async_execute(_upload_task(), visible=False)
-                    except ValueError:
-                        pass
+                    tae.async_execute(self._firmware_upload_task(node_id, fw_path), visible=False)
             else:
                 CTkMessagebox(title='Error', message='Firmware file not selected!!!', icon='cancel')
         else:
             CTkMessagebox(title='Error', message='Undefined Node ID!!!', icon='cancel')
 
 
-    def _get_local_mdf(self):
+    async def _firmware_upload_task(self, node_id: int, fw_path: str):
         """
-        Open a file dialog to select and read a local MDF file.
+        Load the selected firmware image and upload it to the node.
+
+        Messages are hidden for the duration (Observer event via 'common') and the
+        image is parsed off the Tk thread, as hex parsing of large files takes a while.
+
+        Args:
+            node_id (int): The target node.
+            fw_path (str): Path to the firmware file (hex/bin).
+        """
+        extension = os.path.splitext(fw_path)[1][1:].lower()
+        # 1. Hide all messages (Publish event: Block=True)
+        call_set_filter_blocking(True)
+        try:
+            # 2. Load the image in a worker thread
+            try:
+                fw_data = await asyncio.to_thread(_read_firmware, fw_path, extension)
+            except ValueError:
+                self.after(0, self._on_invalid_firmware)
+                return
+            # 3. Execute bootloader procedure
+            await vscp.firmware_upload(node_id, fw_data)
+        finally:
+            # 4. Restore filter state (Publish event: Block=False)
+            call_set_filter_blocking(False)
+
+
+    def _on_invalid_firmware(self):
+        """
+        Report that the selected firmware file could not be loaded.
+        """
+        CTkMessagebox(title='Error', message='Invalid firmware file!!!', icon='cancel')
+
+
+    def _ask_local_mdf_path(self, node_id):
+        """
+        Open a file dialog to select a local MDF file.
+
+        Returns:
+            str: The selected path, or an empty string if nothing was selected.
         """
         result = ''
-        node_id = self._get_node_id()
         if -1 < node_id:
             current_path = os.getcwd()
             filetypes = (('MDF files', '*.mdf'),)
-            mdf_path = ctk.filedialog.askopenfilename(title=f'Select Module Description File for node 0x{node_id:02X}',
+            result = ctk.filedialog.askopenfilename(title=f'Select Module Description File for node 0x{node_id:02X}',
                                                     initialdir=current_path,
-                                                    filetypes=filetypes)
-            try:
-                result = Path(mdf_path).read_bytes()
-            except: # pylint: disable=bare-except
-                pass
+                                                    filetypes=filetypes) or ''
         else:
             CTkMessagebox(title='Error', message='Undefined Node ID!!!', icon='cancel')
         return result
@@ -732,37 +870,166 @@ class Neighbours(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-i
         """
         Handle node configuration.
 
-        Fetches the MDF file (either from URL or local fallback), parses it,
-        and opens the NodeConfiguration window.
+        Fetches the MDF file off the Tk thread and then continues with
+        _open_node_configuration. Menu items stay disabled meanwhile so the
+        same request cannot be started twice.
         """
-        node_id = self._get_node_id()
-        guid = self._get_guid()
-        mdf_link = self._get_mdf_link()
-        # Handle local proxy/tunneling if applicable
-        if 'vscp.local' in mdf_link.lower():
-            link_subst = f'localhost:{get_http_server_port()}'
-            mdf_link = re.sub(re.escape('vscp.local'), link_subst, mdf_link, flags=re.IGNORECASE)
-        mdf = ''
+        node_id, guid, mdf_link = self._get_node_metadata()
+        mdf_link = self._resolve_mdf_link(mdf_link)
+        self._set_menu_items_state('disabled')
+        mdf = self._mdf_cache.get(mdf_link)
+        if mdf:
+            self._mdf_cache.move_to_end(mdf_link)
+            self._open_node_configuration(node_id, guid, mdf)
+        else:
+            tae.async_execute(self._fetch_mdf(node_id, guid, mdf_link), visible=False)
+
+
+    async def _fetch_mdf(self, node_id, guid, mdf_link):
+        """
+        Download the MDF in a worker thread and hand the result back to the Tk thread.
+        """
+        mdf = await asyncio.to_thread(self._download_mdf, mdf_link)
+        self.after(0, self._on_mdf_fetched, node_id, guid, mdf_link, mdf)
+
+
+    def _on_mdf_fetched(self, node_id, guid, mdf_link, mdf): # pylint: disable=too-many-arguments, too-many-positional-arguments
+        """
+        Remember a downloaded MDF for the session and continue with opening the configuration.
+        """
+        self._cache_mdf(mdf_link, mdf)
+        self._open_node_configuration(node_id, guid, mdf)
+
+
+    def _cache_mdf(self, mdf_link, mdf):
+        """
+        Remember a downloaded MDF for the session (bounded LRU, Tk thread only).
+        """
+        if mdf:
+            self._mdf_cache[mdf_link] = mdf
+            if len(self._mdf_cache) > _MDF_CACHE_SIZE:
+                self._mdf_cache.popitem(last=False)
+
+
+    def prefetch_mdfs(self):
+        """
+        Download the MDFs of the listed nodes in the background into the session cache.
+
+        Called on the Tk thread after a scan so that configuring a node does not wait
+        for the network. The links are collected here, nodes sharing an MDF link are
+        fetched once and no more links are fetched than the session cache can hold.
+        """
+        links = dict.fromkeys(self._resolve_mdf_link(meta['mdf']) for meta in self._rendered_nodes.values())
+        links = [link for link in links if link != 'http://' and link not in self._mdf_cache]
+        if links:
+            tae.async_execute(self._prefetch_mdfs(links[:_MDF_CACHE_SIZE]), visible=False)
+
+
+    async def _prefetch_mdfs(self, links):
+        """
+        Fetch the given MDF links in parallel, at most 8 downloads at a time.
+        """
+        semaphore = asyncio.Semaphore(8)
+
+        async def _fetch(link):
+            async with semaphore:
+                return link, await asyncio.to_thread(self._download_mdf, link)
+
+        for link, mdf in await asyncio.gather(*(_fetch(link) for link in links)):
+            if mdf:
+                self.after(0, self._cache_mdf, link, mdf)
+
+
+    @staticmethod
+    def _resolve_mdf_link(mdf_link: str) -> str:
+        """
+        Handle local proxy/tunneling: 'vscp.local' links are served by the built-in HTTP server.
+        """
+        return _VSCP_LOCAL_RE.sub(lambda _: f'localhost:{get_http_server_port()}', mdf_link)
+
+
+    @staticmethod
+    def _download_mdf(mdf_link: str) -> bytes:
+        """
+        Fetch the MDF from the given link, using the disk cache for remote links.
+
+        Links served by the built-in HTTP server (localhost) are always fetched,
+        they are local files already.
+
+        Returns:
+            bytes: The MDF content, or empty bytes if it could not be fetched.
+        """
+        use_disk_cache = not mdf_link.startswith('http://localhost')
+        mdf = _read_cached_mdf(mdf_link) if use_disk_cache else b''
+        if mdf:
+            return mdf
+
+        import requests # pylint: disable=import-outside-toplevel
         try:
-            req = requests.get(mdf_link, timeout=5)
+            req = _http_session().get(mdf_link, timeout=_MDF_TIMEOUT)
             if 200 == int(req.status_code):
                 mdf = req.content
-        except: # pylint: disable=bare-except
+        except requests.RequestException:
             pass
-        if not mdf:
-            mdf = self._get_local_mdf()
-        if mdf:
-            try:
-                mdf_text = mdf.decode('utf-8') if isinstance(mdf, bytes) else str(mdf)
-                vscp.mdf.parse(mdf_text)
-                self._set_menu_items_state('disabled')
-                self.config_window = NodeConfiguration(self, node_id, guid)
-                self.config_window.bring_to_front()
-            except: # pylint: disable=bare-except
-                self.close_node_configuration()
-                CTkMessagebox(title='Error', message='Error while parsing an MDF file!!!', icon='cancel')
+        if mdf and use_disk_cache:
+            _write_cached_mdf(mdf_link, mdf)
+        return mdf
+
+
+    def _open_node_configuration(self, node_id, guid, mdf):
+        """
+        Continue with the fetched MDF (or a local fallback) and parse it off the Tk thread.
+        """
+        mdf_path = '' if mdf else self._ask_local_mdf_path(node_id)
+        if mdf or mdf_path:
+            tae.async_execute(self._parse_mdf(node_id, guid, mdf, mdf_path), visible=False)
         else:
-            CTkMessagebox(title='Error', message='No valid MDF file for the selected node!!!', icon='cancel')
+            self._on_mdf_missing()
+
+
+    def _on_mdf_missing(self):
+        """
+        Report that no MDF is available and re-enable the context menu.
+        """
+        self._set_menu_items_state('normal')
+        CTkMessagebox(title='Error', message='No valid MDF file for the selected node!!!', icon='cancel')
+
+
+    async def _parse_mdf(self, node_id, guid, mdf, mdf_path=''): # pylint: disable=too-many-arguments, too-many-positional-arguments
+        """
+        Read a local MDF if needed, parse it in a worker thread and open the
+        NodeConfiguration window on the Tk thread.
+        """
+        try:
+            if not mdf:
+                mdf = await asyncio.to_thread(_read_file, mdf_path)
+                if not mdf:
+                    self.after(0, self._on_mdf_missing)
+                    return
+            info_data = await asyncio.to_thread(_parse_mdf_info, mdf.decode('utf-8', 'replace'))
+        except Exception: # pylint: disable=broad-exception-caught
+            self.after(0, self._on_mdf_parse_error)
+            return
+        self.after(0, self._show_node_configuration, node_id, guid, info_data)
+
+
+    def _show_node_configuration(self, node_id, guid, info_data):
+        """
+        Open the NodeConfiguration window for the already parsed MDF.
+        """
+        try:
+            self.config_window = NodeConfiguration(self, node_id, guid, info_data)
+            self.config_window.bring_to_front()
+        except Exception: # pylint: disable=broad-exception-caught
+            self._on_mdf_parse_error()
+
+
+    def _on_mdf_parse_error(self):
+        """
+        Close a (partially) opened configuration window and report the MDF parsing error.
+        """
+        self.close_node_configuration()
+        CTkMessagebox(title='Error', message='Error while parsing an MDF file!!!', icon='cancel')
 
 
     def _drop_id_or_reset(self):
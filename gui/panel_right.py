@@ -10,7 +10,6 @@ of the VSCP message logger (treeview) and the detailed event information display
 """
 
 
-import os
 import csv
 from typing import Any, cast
 import customtkinter as ctk
@@ -271,8 +270,8 @@ class Messages(ctk.CTkFrame): # pylint: disable=too-many-ancestors
     def _clear_selected_items(self):
         """Delete only the currently selected messages from the log."""
         selected_rows = self.messages.treeview.selection()
-        for row in selected_rows:
-            self.messages.treeview.delete(row)
+        if selected_rows:
+            self.messages.treeview.delete(*selected_rows)
 
 
     def _save_log(self):
@@ -339,6 +338,7 @@ class EventInfo(ctk.CTkFrame): # pylint: disable=too-few-public-methods, too-man
         self.event_info_box.pack(padx=(5, 5), pady=(5, 5), side='top', anchor='nw', fill='both', expand=True)
         self.event_info_box.bind("<Button-1>", lambda e: 'break')
         self.event_info_box.configure(state='disabled')
+        self._is_empty = True
         # pylint: enable=line-too-long
 
 
@@ -354,20 +354,26 @@ class EventInfo(ctk.CTkFrame): # pylint: disable=too-few-public-methods, too-man
             data: A list containing raw message fields (timestamp, dir, id, priority, class, type, data).
         """
         # pylint: enable=line-too-long
+        if not data and self._is_empty:
+            return
+
         self.event_info_box.configure(state='normal')
         self.event_info_box.delete('1.0', 'end')
-        if 0 != len(data):
+        self._is_empty = not data
+        if data:
             descr_len = 18
             class_id = dictionary.class_id(data[4])
             type_id = dictionary.type_id(class_id, data[5])
             dlc = [int(val, 0) for val in data[6].split()]
             info = dictionary.parse_data(class_id, type_id, dlc)
-            val = ''
+            parts = []
             for idx, item in enumerate(info):
-                val += item[0].ljust(descr_len)[:descr_len] if 0 != idx else item[0] + (os.linesep * 2) # pylint: disable=line-too-long
-                if 0 != idx:
-                    val += item[1] + os.linesep
-            self.event_info_box.insert('end', val)
+                if idx > 0:
+                    parts.append(item[0].ljust(descr_len)[:descr_len])
+                    parts.append(item[1] + '\n')
+                else:
+                    parts.append(item[0] + '\n\n')
+            self.event_info_box.insert('end', ''.join(parts))
         self.event_info_box.configure(state='disabled')
 
 
@@ -11,6 +11,7 @@ It handles displaying, reading, and writing VSCP registers using a Treeview.
 # pylint: disable=too-many-lines
 
 
+import asyncio
 import customtkinter as ctk
 import tk_async_execute as tae
 import vscp
@@ -21,12 +22,42 @@ from .tooltip import ToolTip
 from .popup import CTkFloatingWindow
 
 
-class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes, too-many-ancestors
+# Treeview columns: (id, text, width, minwidth, anchor, cell_anchor)
+_HEADER = (('address',   'Page:Offset',  105, 105, 'center', 'center'),
+           ('access',    'Access',       45,  45,  'center', 'center'),
+           ('value',     'Value',        45,  45,  'center', 'center'),
+           ('toSync',    'To Sync',      45,  45,  'center', 'center'),
+           ('name',      '  Name',       505, 505, 'w',      'w'),
+          )
+
+# Precomputed HEX labels for the byte range (register addresses and values)
+_REG_HEX = tuple(f'0x{i:02X}' for i in range(256))
+
+
+def _format_hex(value):
+    """
+    Formats a register value (int or string such as "0x10") as a HEX string.
+
+    Returns:
+        str: The formatted value, the raw value as string if it cannot be parsed,
+             or None if the value is missing.
+    """
+    if value is None or value == '':
+        return None
+    try:
+        val_int = int(value, 0) if isinstance(value, str) else int(value)
+    except (ValueError, TypeError):
+        return str(value)
+    return f'0x{val_int:02X}'
+
+
+class RegistersTab: # pylint: disable=too-many-instance-attributes
     """
     Tab for viewing and editing VSCP registers.
 
     Displays register data in a treeview and shows detailed information about
-    the selected register in a side panel using a rich text table.
+    the selected register in a side panel using a rich text table. The tab is a
+    controller only - its widgets are placed directly in the parent tab.
     """
 
     def __init__(self, parent, node_id: int):
@@ -44,18 +75,17 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
         self.parent = parent
         self.node_id = node_id
         self.selected_row_id = ''
-        super().__init__(self.parent)
+        self.registers_data = {}
+        self._register_iids = {}
+        self._value_cache = {}
+        self._sorted_pages = []
+        self._sorted_addrs = {}
+        self._unpopulated_pages = {}
 
         self.widget = ctk.CTkFrame(parent, fg_color='transparent')
         self.widget.pack(padx=0, pady=0, side='top', anchor='nw', fill='both', expand=True)
 
-        header = [('address',   'Page:Offset',  105, 105, 'center', 'center'),
-                  ('access',    'Access',       45,  45,  'center', 'center'),
-                  ('value',     'Value',        45,  45,  'center', 'center'),
-                  ('toSync',    'To Sync',      45,  45,  'center', 'center'),
-                  ('name',      '  Name',       505, 505, 'w',      'w'),
-                  ]
-        self.registers = CTkTreeview(self.widget, header, xscroll=False)
+        self.registers = CTkTreeview(self.widget, _HEADER, xscroll=False)
         self.registers.pack(side='left', padx=0, pady=0, fill='both', expand=True)
 
         self.registers.enable_cell_editing(columns=['value'],
@@ -65,6 +95,7 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
                                            format_callback=self._format_input)
 
         self.registers.treeview.bind('<<TreeviewSelect>>', self._update_registers_info)
+        self.registers.treeview.bind('<<TreeviewOpen>>', self._on_page_open)
         self.registers.treeview.bind('<Button-3>', lambda event: self._show_menu(event, self.dropdown))
         self.registers.treeview.bind('<Button-1>', self._on_treeview_click)
 
@@ -90,7 +121,10 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
         # ----------------------------
 
         # --- Info Panel ---
-        temp_fg_color = tuple(self._fg_color) if isinstance(self._fg_color, list) else self._fg_color
+        # Resolve the color a default CTkFrame placed in the tab would get
+        frame_theme = ctk.ThemeManager.theme['CTkFrame']
+        fg_color = frame_theme['top_fg_color'] if parent.cget('fg_color') == frame_theme['fg_color'] else frame_theme['fg_color']
+        temp_fg_color = tuple(fg_color) if isinstance(fg_color, list) else fg_color
         self.container_bg_color = temp_fg_color  # Store for dynamic widgets background inheritance
 
         self.info_container = ctk.CTkFrame(self.widget, width=350, fg_color=temp_fg_color)
@@ -114,7 +148,7 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
         self.dynamic_frame = ctk.CTkFrame(self.info_container, fg_color="transparent")
 
         # Start async read of real register values
-        tae.async_execute(self._prepare_registers_data(), wait=False, visible=False, pop_up=False, callback=None, master=self)
+        tae.async_execute(self._prepare_registers_data(), wait=False, visible=False, pop_up=False, callback=None, master=self.widget)
         # pylint: enable=line-too-long
 
 
@@ -122,23 +156,49 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
         """
         Populates the register treeview with data.
 
-        Iterates through the register data structure (organized by page and register address)
-        and inserts rows into the treeview.
+        Only page rows are inserted up front, each with a placeholder child so it
+        can be expanded. Register rows of a page are inserted on its first expansion
+        (see _on_page_open), so startup cost depends on the number of pages only.
         """
-        result = []
-        for page, registers in self.registers_data.items():
-            child = []
-            for register, data in registers.items():
-                row = {'text': f'0x{register:02X}',
-                       'values': [data['access'], data['value'], data['to_sync'], data['name']]}
-                child.append(row)
-            text = f'Page {page:d}' if 0 <= page else 'Standard regs'
-            entry = {'text': text, 'child': child, 'open': False}
-            result.append(entry)
+        self._register_iids = {}
+        self._value_cache = {}
+        self._unpopulated_pages = {f'page_{page}': page for page in self.registers_data}
+        result = [{'text': f'Page {page:d}' if page >= 0 else 'Standard regs',
+                   'iid': iid,
+                   'open': False,
+                   'child': [{'text': '', 'iid': f'{iid}_placeholder'}] if self.registers_data[page] else []} # pylint: disable=line-too-long
+                  for iid, page in self._unpopulated_pages.items()]
         if result:
             self.registers.insert_items(result, auto_scroll=False)
 
 
+    def _on_page_open(self, _):
+        """
+        Inserts register rows of a page when it is expanded for the first time.
+
+        Each register row gets an explicit item ID, indexed by (page, address) for
+        direct lookup on value updates. Rows are built from registers_data, so values
+        read while the page was collapsed are shown.
+        """
+        page_iid = self.registers.treeview.focus()
+        page = self._unpopulated_pages.pop(page_iid, None)
+        if page is None:
+            return
+
+        registers = self.registers_data[page]
+        for register, data in registers.items():
+            self._register_iids[(page, register)] = f'reg_{page}_{register}'
+            self._value_cache[(page, register)] = (data['value'], data['to_sync'])
+
+        child = [{'text': _REG_HEX[register],
+                  'iid': self._register_iids[(page, register)],
+                  'values': (data['access'], data['value'], data['to_sync'], data['name'])}
+                 for register, data in registers.items()]
+
+        self.registers.treeview.delete(f'{page_iid}_placeholder')
+        self.registers.insert_items(child, parent=page_iid, auto_scroll=False)
+
+
     def _on_treeview_click(self, event):
         """
         Handles click events on the treeview to deselect items if clicked on empty space.
@@ -175,10 +235,11 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
 
         # 2. Calculate total chunks for progress bar
         sorted_pages = sorted(registers_map.keys())
+        sorted_addrs = {page: sorted(registers_map[page]) for page in sorted_pages}
         total_chunks = 0
 
         for page in sorted_pages:
-            addresses = sorted(registers_map[page])
+            addresses = sorted_addrs[page]
             if not addresses:
                 continue
 
@@ -202,9 +263,11 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
         progress = start_progress + (0.1 if start_progress == 0 else 0)
         update_progress(progress)
 
-        # 3. Read registers page by page
+        # 3. Read registers page by page. Treeview updates are deferred and applied
+        #    in a single pass afterwards, so the tree repaints once instead of per chunk.
+        pending_updates = []
         for page in sorted_pages:
-            addresses = sorted(registers_map[page])
+            addresses = sorted_addrs[page]
             if not addresses:
                 continue
 
@@ -230,17 +293,20 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
                 if values:
                     for idx, val in enumerate(values):
                         reg_addr = start_reg + idx
-                        hex_value = f'0x{val:02X}'
+                        hex_value = _REG_HEX[val]
 
                         if reg_addr in self.registers_data[page]:
                             self.registers_data[page][reg_addr]['value'] = hex_value
                             self.registers_data[page][reg_addr]['to_sync'] = vscp.mdf.sync_read
 
-                        self._update_treeview_value(page, reg_addr, hex_value, set_sync=vscp.mdf.sync_read) # pylint: disable=line-too-long
+                        pending_updates.append((page, reg_addr, hex_value))
 
                 progress += step
                 update_progress(progress)
 
+        for page, reg_addr, hex_value in pending_updates:
+            self._update_treeview_value(page, reg_addr, hex_value, set_sync=vscp.mdf.sync_read)
+
         vscp.set_async_work(False)
         update_progress(1.0)
 
@@ -324,7 +390,7 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
                     # Update local data and UI with verified values
                     for idx, val in enumerate(returned_values):
                         reg_addr = start_reg + idx
-                        hex_value = f'0x{val:02X}'
+                        hex_value = _REG_HEX[val]
 
                         if reg_addr in self.registers_data[page]:
                             self.registers_data[page][reg_addr]['value'] = hex_value
@@ -344,10 +410,7 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
         Prepares the registers map and delegates to _execute_read_registers.
         """
         # Prepare map of all registers: {page: [list_of_addresses]}
-        registers_to_read = {}
-        for page, regs in self.registers_data.items():
-            if regs:
-                registers_to_read[page] = list(regs.keys())
+        registers_to_read = {page: self._sorted_addrs[page] for page in self._sorted_pages if self._sorted_addrs[page]} # pylint: disable=line-too-long
 
         await self._execute_read_registers(registers_to_read, start_progress)
 
@@ -458,7 +521,10 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
         vscp.set_async_work(True)
         update_progress(0.05)
 
-        self.registers_data = vscp.mdf.get_registers_info()
+        self.registers_data = await asyncio.to_thread(vscp.mdf.get_registers_info)
+        # MDF layout does not change during the window's lifetime - sort keys once
+        self._sorted_pages = sorted(self.registers_data)
+        self._sorted_addrs = {page: sorted(self.registers_data[page]) for page in self._sorted_pages}
         self._insert_registers_data()
 
         progress = 0.1
@@ -473,29 +539,30 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
         """
         Updates a specific register value in the Treeview.
 
+        Cells whose displayed value (and sync marker) are unchanged are not
+        touched, so re-reading a mostly static node causes no row redraws.
+
         Args:
             page (int): The register page.
             reg_addr (int): The register address.
             hex_value (str): The new value formatted as a hex string.
             set_sync (str): If not None, sets the 'toSync' column to this value.
         """
-        page_text = f'Page {page:d}' if page >= 0 else 'Standard regs'
-        reg_text = f'0x{reg_addr:02X}'
-        is_updated = False
-
-        for page_item in self.registers.treeview.get_children():
-            if is_updated:
-                break
-            if self.registers.treeview.item(page_item, "text") == page_text:
-                for reg_item in self.registers.treeview.get_children(page_item):
-                    if self.registers.treeview.item(reg_item, "text") == reg_text:
-                        self.registers.treeview.set(reg_item, column='value', value=hex_value)
+        key = (page, reg_addr)
+        iid = self._register_iids.get(key)
+        if iid is None:
+            return
 
-                        if set_sync is not None:
-                            self.registers.treeview.set(reg_item, column='toSync', value=set_sync)
+        cached_value, cached_sync = self._value_cache.get(key, (None, None))
+        sync = cached_sync if set_sync is None else set_sync
+        if cached_value == hex_value and cached_sync == sync:
+            return
 
-                        is_updated = True
-                        break
+        if cached_value != hex_value:
+            self.registers.treeview.set(iid, column='value', value=hex_value)
+        if cached_sync != sync:
+            self.registers.treeview.set(iid, column='toSync', value=sync)
+        self._value_cache[key] = (hex_value, sync)
 
 
     def _can_edit_cell(self, _row_id, col_key, _current_value, row_data):
@@ -716,6 +783,7 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
 
                             if value_changed:
                                 self.registers.treeview.set(row_id, column='toSync', value=vscp.mdf.sync_write) # pylint: disable=line-too-long
+                                self._value_cache[(page, reg_addr)] = (formatted_hex, vscp.mdf.sync_write) # pylint: disable=line-too-long
                                 if reg_info:
                                     reg_info['value'] = formatted_hex
                                     reg_info['to_sync'] = vscp.mdf.sync_write
@@ -744,20 +812,6 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
         Args:
             _: The event object (unused).
         """
-        def format_hex(value):
-            """Helper to safely format a value to HEX string. Returns None if value is missing."""
-            if value is None or value == "":
-                return None
-            try:
-                # Handle int or string input (e.g. "0x10" or 16)
-                if isinstance(value, str):
-                    val_int = int(value, 0) # Handles "0x" prefix automatically
-                else:
-                    val_int = int(value)
-                return f"0x{val_int:02X}"
-            except (ValueError, TypeError):
-                return str(value)
-
         self.registers_info.update_data({})
         for widget in self.dynamic_frame.winfo_children():
             widget.destroy()
@@ -791,16 +845,16 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
                 if data.get('width') is not None:
                     rows.append(("<b>Width</b>:", str(data.get('width'))))
 
-                if (min_val := format_hex(data.get('min'))) is not None:
+                if (min_val := _format_hex(data.get('min'))) is not None:
                     rows.append(("<b>Min value</b>:", min_val))
 
-                if (max_val := format_hex(data.get('max'))) is not None:
+                if (max_val := _format_hex(data.get('max'))) is not None:
                     rows.append(("<b>Max value</b>:", max_val))
 
-                if (default_val := format_hex(data.get('default'))) is not None:
+                if (default_val := _format_hex(data.get('default'))) is not None:
                     rows.append(("<b>Default value</b>:", default_val))
 
-                if (curr_val := format_hex(data.get('value'))) is not None:
+                if (curr_val := _format_hex(data.get('value'))) is not None:
                     rows.append(("<b>Value</b>:", curr_val))
 
                 # Prepare dictionary for ScrollableInfoTable
@@ -1009,19 +1063,6 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
         # Re-fetch data for panel
         data = self.registers_data[page][register]
 
-        # Helper format (duplicate logic, could be method)
-        def format_hex(value):
-            if value is None or value == "":
-                return None
-            try:
-                if isinstance(value, str):
-                    val_int = int(value, 0)
-                else:
-                    val_int = int(value)
-                return f"0x{val_int:02X}"
-            except: # pylint: disable=bare-except
-                return str(value)
-
         rows = [
             ("Page:", str(page)),
             ("Register:", f"0x{register:02X}")
@@ -1030,13 +1071,13 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
             rows.append(("Access:", str(data.get('access'))))
         if data.get('width') is not None:
             rows.append(("Width:", str(data.get('width'))))
-        if (min_val := format_hex(data.get('min'))) is not None:
+        if (min_val := _format_hex(data.get('min'))) is not None:
             rows.append(("Min:", min_val))
-        if (max_val := format_hex(data.get('max'))) is not None:
+        if (max_val := _format_hex(data.get('max'))) is not None:
             rows.append(("Max:", max_val))
-        if (default_val := format_hex(data.get('default'))) is not None:
+        if (default_val := _format_hex(data.get('default'))) is not None:
             rows.append(("Default val.:", default_val))
-        if (curr_val := format_hex(data.get('value'))) is not None:
+        if (curr_val := _format_hex(data.get('value'))) is not None:
             rows.append(("Value:", curr_val))
 
         table_data = {
@@ -1120,7 +1161,7 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
         state_write_sel = 'normal' if selected_modified else 'disabled'
         self.dropdown_bt_write_selected.configure(state=state_write_sel)
 
-        if '' != self.selected_row_id:
+        if self.selected_row_id:
             menu.popup(event.x_root, event.y_root)
             # Bind click event to parent window to handle "click outside"
             self._click_bind_id = self.widget.winfo_toplevel().bind("<Button-1>", self._close_popup, "+") # pylint: disable=line-too-long
@@ -1160,22 +1201,22 @@ class RegistersTab(ctk.CTkFrame): # pylint: disable=too-many-instance-attributes
     def _bt_read_all_registers(self):
         """Callback for 'Read all registers'."""
         self._close_popup()
-        tae.async_execute(self._read_all_registers(), wait=False, visible=False, pop_up=False, callback=None, master=self) # pylint: disable=line-too-long
+        tae.async_execute(self._read_all_registers(), wait=False, visible=False, pop_up=False, callback=None, master=self.widget) # pylint: disable=line-too-long
 
 
     def _bt_read_selected_registers(self):
         """Callback for 'Read selected registers'."""
         self._close_popup()
-        tae.async_execute(self._read_selected_registers(), wait=False, visible=False, pop_up=False, callback=None, master=self) # pylint: disable=line-too-long
+        tae.async_execute(self._read_selected_registers(), wait=False, visible=False, pop_up=False, callback=None, master=self.widget) # pylint: disable=line-too-long
 
 
     def _bt_write_selected_registers(self):
         """Callback for 'Write selected registers'."""
         self._close_popup()
-        tae.async_execute(self._write_selected_registers(), wait=False, visible=False, pop_up=False, callback=None, master=self) # pylint: disable=line-too-long
+        tae.async_execute(self._write_selected_registers(), wait=False, visible=False, pop_up=False, callback=None, master=self.widget) # pylint: disable=line-too-long
 
 
     def _bt_write_all_registers(self):
         """Callback for 'Write all registers'."""
         self._close_popup()
-        tae.async_execute(self._write_all_registers(), wait=False, visible=False, pop_up=False, callback=None, master=self) # pylint: disable=line-too-long
+        tae.async_execute(self._write_all_registers(), wait=False, visible=False, pop_up=False, callback=None, master=self.widget) # pylint: disable=line-too-long
@@ -165,13 +165,13 @@ class CTkTreeview(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-
         Extract column keys from the header definition.
 
         Args:
-            items: Header definition list.
+            items: Header definition list or tuple.
 
         Returns:
             list: List of column keys or None.
         """
         result = None
-        if isinstance(items, list) and len(items) > 1:
+        if isinstance(items, (list, tuple)) and len(items) > 1:
             result = []
             for idx, item in enumerate(items):
                 if isinstance(item, (tuple, list)):
@@ -214,6 +214,7 @@ class CTkTreeview(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-
         Recursive method to insert items into the treeview.
         Applies active filter to new items (hides them if they don't match).
         Supports 'open' key to set initial expansion state.
+        Supports 'iid' key to assign an explicit item identifier.
         Supports 'auto_scroll' parameter to toggle scrolling to inserted item.
 
         Args:
@@ -221,17 +222,22 @@ class CTkTreeview(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-
             parent: The parent item ID (default is root).
             auto_scroll: If True (default), ensures the inserted item is visible.
         """
+        # Rows go straight to the Tcl 'insert' command, skipping ttk's per-call option formatting
+        tk_call = self.treeview.tk.call
+        path = str(self.treeview)
+        filter_condition = self._filter_condition
         for item in items:
             if isinstance(item, dict):
-                text = item['text'] if 'text' in item else ''
-                values = item['values'] if 'values' in item else []
-                is_open = item.get('open', False)
+                text = item.get('text', '')
+                values = item.get('values', [])
+                iid = ('-id', item['iid']) if 'iid' in item else ()
 
-                row = self.treeview.insert(parent, 'end', text=text, values=values, open=is_open)
+                row = tk_call(path, 'insert', parent, 'end', *iid, '-text', text,
+                              '-values', tuple(values), '-open', bool(item.get('open', False)))
 
                 # Check active filter for the new item
-                if self._filter_condition is not None:
-                    if not self._filter_condition(text, values):
+                if filter_condition is not None:
+                    if not filter_condition(text, values):
                         idx = self.treeview.index(row)
                         self.treeview.detach(row)
                         self._hidden_items.append((row, parent, idx))
@@ -245,7 +251,9 @@ class CTkTreeview(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-
 
     def delete_all_items(self):
         """Remove all items from the treeview."""
-        self.treeview.delete(*self.treeview.get_children())
+        children = self.treeview.get_children()
+        if children:
+            self.treeview.delete(*children)
         self._hidden_items.clear()
         self._modified_cells.clear()
 
@@ -253,9 +261,9 @@ class CTkTreeview(ctk.CTkFrame): # pylint: disable=too-many-ancestors, too-many-
     def delete_selected_items(self):
         """Remove currently selected items from the treeview."""
         selected_rows = self.treeview.selection()
-        for row in selected_rows:
-            self.treeview.delete(row)
-            self._modified_cells = {cell for cell in self._modified_cells if cell[0] != row}
+        if selected_rows:
+            self.treeview.delete(*selected_rows)
+            self._modified_cells = {cell for cell in self._modified_cells if cell[0] not in selected_rows}
 
 
     def set_item_style(self, item_id, bg_color=None, fg_color=None, font=None):
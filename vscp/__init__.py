@@ -16,6 +16,7 @@ from vscp.mdf_parser import mdf
 from vscp.tools import  set_async_work, is_async_work,                  \
                         set_this_node_nickname, get_this_node_nickname, \
                         is_node_on_list, append_node, get_nodes,        \
+                        get_nodes_generation,                           \
                         probe_node, get_node_info, scan,                \
                         send_host_datetime, set_nickname,               \
                         add_node_id_observer, update_node_id,           \
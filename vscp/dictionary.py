@@ -716,20 +716,8 @@ class Dictionary:
 
     def convert_blalgo(self, data: list, _) -> str:
         """Converts bootloader algorithm code to name."""
-        results = {
-            0x00:   'VSCP algorithm',
-            0x01:   'Microchip PIC algorithm',
-            0x10:   'Atmel AVR algorithm',
-            0x20:   'NXP ARM algorithm',
-            0x30:   'ST ARM algorithm',
-            0x40:   'Freescale algorithm',
-            0x50:   'Espressif algorithm',
-            0xFF:   'No bootloader available',
-        }
-        for key in range(0xF0, 0xFF):
-            results[key] = 'User defined algorithm'
         try:
-            result = results[int.from_bytes(data, 'big', signed=False)]
+            result = _bootloader_algorithms[int.from_bytes(data, 'big', signed=False)]
         except (KeyError, ValueError):
             result = 'Undefined algorithm'
         return result
@@ -1543,6 +1531,17 @@ def modify_dictionary(input_defs: list, option: str) -> list:
     return items
 
 
+_bootloader_algorithms = {
+    0x00:   'VSCP algorithm',
+    0x01:   'Microchip PIC algorithm',
+    0x10:   'Atmel AVR algorithm',
+    0x20:   'NXP ARM algorithm',
+    0x30:   'ST ARM algorithm',
+    0x40:   'Freescale algorithm',
+    0x50:   'Espressif algorithm',
+    **{key: 'User defined algorithm' for key in range(0xF0, 0xFF)},
+    0xFF:   'No bootloader available',
+}
 _vscp_priority = [
     {'name': 'Highest',     'id': 0},
     {'name': 'Even higher', 'id': 1},
@@ -12,8 +12,6 @@ and other device-specific data.
 # pylint: disable=too-many-lines
 
 
-# TODO remove debug print
-# import pprint
 from typing import Dict, Any, cast
 import re
 import json
@@ -33,6 +31,8 @@ class MdfParser:
         self.source = 'none'
         self.sync_read = '●'
         self.sync_write = '⬤'
+        self._raw = None
+        self._cache = {}
 
 
     def parse(self, data: str) -> None:
@@ -40,11 +40,16 @@ class MdfParser:
         Parses the provided MDF data string.
 
         Detects whether the data is XML or JSON and populates the internal
-        structure accordingly.
+        structure accordingly. Re-parsing identical content keeps the already
+        parsed structure and memoized results.
 
         Args:
             data (str): The MDF content as a string (XML or JSON).
         """
+        if data == self._raw:
+            return
+        self._raw = data
+        self._cache = {}
         try:
             # Use strip() to handle potential whitespace before the first tag
             data_clean = data.strip()
@@ -109,6 +114,9 @@ class MdfParser:
         Returns:
             dict: A dictionary containing module information.
         """
+        if 'module_info' in self._cache:
+            return dict(self._cache['module_info'])
+
         result = {}
         result['name']          = self.mdf.get('name', '')
         result['model']         = self.mdf.get('model', '')
@@ -130,7 +138,8 @@ class MdfParser:
 
         # Return English description by default
         result['description'] = self._get_eng_text(result['description'], True)
-        return result
+        self._cache['module_info'] = result
+        return dict(result)
 
 
     def get_module_manufacturer(self) -> dict:
@@ -223,6 +232,9 @@ class MdfParser:
         Returns:
             dict: A dictionary with 'algorithm', 'blockcount', and 'blocksize' keys.
         """
+        if 'boot_algorithm' in self._cache:
+            return dict(self._cache['boot_algorithm'])
+
         boot = self.mdf.get('boot', {})
         if 'xml' == self.source and isinstance(boot, dict):
             boot = cast(Dict[str, Any], self._normalize_xml_keys(boot))
@@ -234,7 +246,8 @@ class MdfParser:
                       }
         else:
             result = {}
-        return result
+        self._cache['boot_algorithm'] = result
+        return dict(result)
 
 
     def get_registers_info(self) -> dict: # pylint: disable=too-many-locals, too-many-branches, too-many-statements
@@ -256,10 +269,6 @@ class MdfParser:
 
         data = self._parse_registers_data()
 
-        # TODO remove debug print
-        # pp = pprint.PrettyPrinter(indent=2, width=160)
-        # pp.pprint(data)
-
         for item in data: # pylint: disable=too-many-nested-blocks
             if 'page' in item:
                 try:
@@ -371,8 +380,6 @@ class MdfParser:
 
                 except: # pylint: disable=bare-except
                     pass
-        # TODO remove debug print
-        # pp.pprint(result)
         return result
 
 
@@ -34,13 +34,17 @@ FIRMWARE_WRITE_ACK_CHECK_RETRIES = int(BLOCK_WRITE_GAP / PROBE_SLEEP)
 FIRMWARE_BLOCK_WRITE_RETRIES = 5
 FIRMWARE_CHUNK_WRITE_RETRIES = 5
 FIRMWARE_FLASH_ERASED_VALUE = 0xFF
+SCAN_PROBE_BATCH = 16
 
 
 _message = Message()
 _nodes: dict = {}
+_nodes_generation: int = 0
 _async_work: bool = False
 _this_nickname: int = THIS_NODE_NICKNAME
 _node_id_observers: list = []
+# Table-driven CRC-16 used for firmware blocks and images; the lookup table is built once
+_firmware_crc = Calculator(Crc16.IBM_3740.value, True)
 
 
 def set_async_work(async_work: bool) -> None:
@@ -140,8 +144,10 @@ def append_node(node: dict) -> None:
     """
     Adds or updates a node in the internal storage.
     """
+    global _nodes_generation # pylint: disable=global-statement
     if 'id' in node:
         _nodes[node['id']] = node
+        _nodes_generation += 1
 
 
 def update_node_id(old_id: int, new_id: int) -> None:
@@ -153,10 +159,12 @@ def update_node_id(old_id: int, new_id: int) -> None:
         old_id (int): The current node ID.
         new_id (int): The new node ID.
     """
+    global _nodes_generation # pylint: disable=global-statement
     if old_id in _nodes:
         node_data = _nodes.pop(old_id)
         node_data['id'] = new_id
         _nodes[new_id] = node_data
+        _nodes_generation += 1
         _notify_node_id_observers(old_id, new_id)
 
 
@@ -168,11 +176,21 @@ def get_nodes() -> list:
     return sorted(list(_nodes.values()), key=lambda x: x['id'])
 
 
+def get_nodes_generation() -> int:
+    """
+    Returns a counter that changes whenever the internal node list is modified.
+    Lets the UI skip rebuilding views of a node list it has already displayed.
+    """
+    return _nodes_generation
+
+
 def clear_nodes() -> None:
     """
     Clears the internal storage of discovered nodes.
     """
+    global _nodes_generation # pylint: disable=global-statement
     _nodes.clear()
+    _nodes_generation += 1
 
 
 def send_vscp_event(priority_name: str, class_name: str, type_name: str, data: list, nickname: int | None = None) -> None: # pylint: disable=line-too-long
@@ -255,6 +273,49 @@ async def probe_node(nickname: int):
     return result
 
 
+async def _probe_nodes(nicknames: list) -> set:
+    """
+    Probes several nicknames within a single probe window.
+
+    Sends NEW_NODE_ONLINE for every nickname back to back and then collects
+    PROBE_ACK responses, instead of waiting out the window for each nickname in turn.
+    Internal function used by `scan`.
+
+    Args:
+        nicknames (list): The nicknames to probe.
+
+    Returns:
+        set: The nicknames that acknowledged the probe.
+    """
+    pending = set(nicknames)
+    result = set()
+    for nickname in nicknames:
+        _message.send({
+            'class':        {'id': None,    'name': 'CLASS1.PROTOCOL'},
+            'type':         {'id': None,    'name': 'NEW_NODE_ONLINE'},
+            'priority':     {'id': None,    'name': 'Lower'},
+            'nickName':     _this_nickname,
+            'isHardCoded':  False,
+            'data':         [nickname]
+            })
+    for _ in range(PROBE_RETRIES_SHORT):
+        await asyncio.sleep(PROBE_SLEEP)
+        while _message.available() > 0:
+            vscp_result = _message.pop_front()
+            if vscp_result is not None:
+                check = (   (vscp_result['class']['name'] == 'CLASS1.PROTOCOL')
+                        and (vscp_result['type']['name'] == 'PROBE_ACK')
+                        and (vscp_result['nickName'] in pending)
+                        )
+                if check is True:
+                    pending.discard(vscp_result['nickName'])
+                    result.add(vscp_result['nickName'])
+        if not pending:
+            break
+    _message.flush()
+    return result
+
+
 async def get_node_info(nickname: int) -> dict: # pylint: disable=too-many-branches, too-many-locals, too-many-statements
     """
     Retrieves detailed information (GUID, MDF) from a node.
@@ -335,7 +396,7 @@ async def get_node_info(nickname: int) -> dict: # pylint: disable=too-many-branc
     return {'id': nickname, 'isHardCoded': is_hardcoded, 'guid': {'val': guid, 'str': guid_str(guid)}, 'mdf': mdf} if all_data_received else {} # pylint: disable=line-too-long
 
 
-async def scan(min_node_id: int = 0, max_node_id: int = MAX_NICKNAME_ID) -> int:
+async def scan(min_node_id: int = 0, max_node_id: int = MAX_NICKNAME_ID, on_node=None) -> int:
     """
     Scans the bus for active nodes within a specified range.
     Updates the internal dictionary store.
@@ -343,11 +404,13 @@ async def scan(min_node_id: int = 0, max_node_id: int = MAX_NICKNAME_ID) -> int:
     Args:
         min_node_id (int, optional): Start of range (inclusive). Defaults to 0.
         max_node_id (int, optional): End of range (inclusive). Defaults to 254.
+        on_node (callable, optional): Called with each node record as soon as its
+            info has been read, so results can be shown before the scan completes.
 
     Returns:
         int: The number of nodes found.
     """
-    global _async_work # pylint: disable=global-statement
+    global _async_work, _nodes_generation # pylint: disable=global-statement
     progress = 0.0
     update_progress(progress)
     result = -1
@@ -355,18 +418,22 @@ async def scan(min_node_id: int = 0, max_node_id: int = MAX_NICKNAME_ID) -> int:
         _async_work = True
         _message.enable_feeder()
         _nodes.clear()
+        _nodes_generation += 1
         min_node_id = max(min_node_id, 0)
         if max_node_id < min_node_id:
             max_node_id = min_node_id + 1
         max_node_id = min(max_node_id, MAX_NICKNAME_ID)
-        step = 0.5 / (max_node_id - min_node_id + 1)
-
-        for idx in range(min_node_id, max_node_id + 1):
-            if idx is not _this_nickname:
-                nickname = await probe_node(idx)
-                if nickname is not None and nickname not in _nodes:
+        candidates = [idx for idx in range(min_node_id, max_node_id + 1) if idx != _this_nickname]
+        step = 0.5 / max(len(candidates), 1)
+
+        # Probe in batches: one probe window per batch instead of one per nickname
+        for offset in range(0, len(candidates), SCAN_PROBE_BATCH):
+            batch = candidates[offset:offset + SCAN_PROBE_BATCH]
+            for nickname in sorted(await _probe_nodes(batch)):
+                if nickname not in _nodes:
                     _nodes[nickname] = {'id': nickname}
-            progress = progress + step
+                    _nodes_generation += 1
+            progress = progress + step * len(batch)
             update_progress(progress)
 
         result = len(_nodes)
@@ -377,6 +444,9 @@ async def scan(min_node_id: int = 0, max_node_id: int = MAX_NICKNAME_ID) -> int:
                 info = await get_node_info(node_id)
                 if info:
                     _nodes[node_id] = info
+                    _nodes_generation += 1
+                    if callable(on_node):
+                        on_node(info)
                 progress = progress + step
                 update_progress(progress)
 
@@ -867,14 +937,14 @@ async def _firmware_send_start_data_block(nickname: int, block_id: int) -> bool:
     return result
 
 
-async def _firmware_send_data_chunk(nickname: int, chunk_gap: int, chunk: list) -> bool:
+async def _firmware_send_data_chunk(nickname: int, chunk_gap: int, chunk: memoryview) -> bool:
     """
     Sends a small chunk of firmware data (max 8 bytes).
 
     Args:
         nickname (int): The target node.
         chunk_gap (int): Delay before sending.
-        chunk (list): Byte data to send.
+        chunk (memoryview): Byte data to send.
 
     Returns:
         bool: True if acknowledged, False otherwise.
@@ -888,7 +958,7 @@ async def _firmware_send_data_chunk(nickname: int, chunk_gap: int, chunk: list)
         'isHardCoded':  False,
         }
     await asyncio.sleep(chunk_gap)
-    vscp_msg['data'] = chunk
+    vscp_msg['data'] = list(chunk)
     retry = 0
     while retry < FIRMWARE_CHUNK_WRITE_RETRIES:
         norepeat = False
@@ -923,14 +993,14 @@ async def _firmware_send_data_chunk(nickname: int, chunk_gap: int, chunk: list)
     return result
 
 
-async def _firmware_send_data_block(nickname: int, chunk_gap: int, block: list, progress: float, progress_chunk: float) -> bool: # pylint: disable=line-too-long, too-many-locals
+async def _firmware_send_data_block(nickname: int, chunk_gap: int, block: memoryview, progress: float, progress_chunk: float) -> bool: # pylint: disable=line-too-long, too-many-locals
     """
     Sends a full firmware block by splitting it into smaller chunks.
 
     Args:
         nickname (int): The target node.
         chunk_gap (int): Delay between chunks.
-        block (list): The complete block data.
+        block (memoryview): The complete block data.
         progress (float): Current base progress.
         progress_chunk (float): Progress increment per chunk.
 
@@ -938,11 +1008,12 @@ async def _firmware_send_data_block(nickname: int, chunk_gap: int, block: list,
         bool: True if the entire block was successfully sent and verified, False otherwise.
     """
     result = False
-    block_crc = Calculator(Crc16.IBM_3740.value, True).checksum(bytes(block))
+    block_crc = _firmware_crc.checksum(bytes(block))
     chunks = int(len(block) / MAX_CAN_DLC)
     step = progress_chunk / chunks
     block_progress = progress
-    for chunk in [block[i:i + MAX_CAN_DLC] for i in range(0, len(block), MAX_CAN_DLC)]:
+    for offset in range(0, len(block), MAX_CAN_DLC):
+        chunk = block[offset:offset + MAX_CAN_DLC]
         result = await _firmware_send_data_chunk(nickname, chunk_gap, chunk)
         if result is False:
             break
@@ -1085,7 +1156,7 @@ async def _firmware_activate_new_image(nickname: int, firmware_crc: int) -> bool
     return result
 
 
-async def firmware_upload(nickname: int, firmware: list) -> bool: # pylint: disable=too-many-locals
+async def firmware_upload(nickname: int, firmware: bytearray) -> bool: # pylint: disable=too-many-locals
     """
     Performs a complete firmware upload to a target node.
 
@@ -1094,7 +1165,7 @@ async def firmware_upload(nickname: int, firmware: list) -> bool: # pylint: disa
 
     Args:
         nickname (int): The target node ID.
-        firmware (list): The firmware binary data as a list of bytes.
+        firmware (bytearray): The firmware binary data.
 
     Returns:
         bool: True if the upload process completed successfully, False otherwise.
@@ -1115,13 +1186,16 @@ async def firmware_upload(nickname: int, firmware: list) -> bool: # pylint: disa
             number_of_blocks = device_block_params[1]
             block_gap = len(firmware) % flash_block_size
             if 0 != block_gap:
-                firmware.extend(FIRMWARE_FLASH_ERASED_VALUE for _ in range(flash_block_size - block_gap)) # pylint: disable=line-too-long
-            firmware_crc = Calculator(Crc16.IBM_3740.value, True).checksum(bytes(firmware))
+                firmware.extend(bytes((FIRMWARE_FLASH_ERASED_VALUE,)) * (flash_block_size - block_gap))
+            # The image CRC is computed in pure Python; keep the message loop running meanwhile
+            firmware_crc = await asyncio.to_thread(_firmware_crc.checksum, bytes(firmware))
             blocks_to_program = int(len(firmware) / flash_block_size)
             if blocks_to_program <= number_of_blocks:
                 step = 0.96 / blocks_to_program
                 success = False
-                for idx, block in enumerate([firmware[i:i + flash_block_size] for i in range(0, len(firmware), flash_block_size)]): # pylint: disable=line-too-long
+                image = memoryview(firmware)
+                for idx, offset in enumerate(range(0, len(firmware), flash_block_size)):
+                    block = image[offset:offset + flash_block_size]
                     retry = 0
                     while retry < FIRMWARE_BLOCK_WRITE_RETRIES:
                         chunk_gap = PROBE_SLEEP * (1 << retry)